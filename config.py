@@ -9,16 +9,41 @@ All scripts import from here. Override with environment variables:
     HYPERDOCS_PROJECT_ID     — Claude Code project identifier (optional)
     ANTHROPIC_API_KEY        — Required for phases 1-3
 """
+import bisect
+import functools
 import os
-import sys
 from pathlib import Path
 
+__all__ = [
+    "load_env",
+    "SESSION_ID",
+    "SESSION_SHORT",
+    "REPO_ROOT",
+    "CLAUDE_SESSIONS_DIR",
+    "CHAT_HISTORY_PATH",
+    "CHAT_HISTORY_DIR",
+    "OUTPUT_DIR",
+    "SESSION_OUTPUT_STR",
+    "SESSION_OUTPUT_DIR",
+    "ARCHIVE_PATH",
+    "PROJECT_ID",
+    "V5_SOURCE_DIR",
+    "STORE_DIR",
+    "SESSIONS_STORE_DIR",
+    "INDEXES_DIR",
+    "HYPERDOCS_STORE_DIR",
+    "HYPERDOC_INPUTS_DIR",
+    "CHAT_ARCHIVE_DIR",
+    "get_session_output_dir",
+    "get_session_file",
+]
+
 
 def load_env():
     """Load .env file from repo root or home directory."""
     try:
         from dotenv import load_dotenv
-        repo_env = Path(__file__).resolve().parent / ".env"
+        repo_env = REPO_ROOT / ".env"
         if repo_env.exists():
             load_dotenv(repo_env)
         else:
@@ -27,87 +52,118 @@ def load_env():
         pass
 
 
+# One snapshot of the environment; every setting below reads from it, so
+# they all see the same values even if os.environ changes mid-import
+_ENV = os.environ.copy()
+
 # ── Session ────────────────────────────────────────────────────
-SESSION_ID = os.getenv("HYPERDOCS_SESSION_ID", "")
+SESSION_ID = _ENV.get("HYPERDOCS_SESSION_ID", "")
 SESSION_SHORT = SESSION_ID[:8] if SESSION_ID else ""
 
 # ── Paths ──────────────────────────────────────────────────────
-REPO_ROOT = Path(__file__).resolve().parent
-CLAUDE_SESSIONS_DIR = Path.home() / ".claude" / "projects"
+# abspath, not resolve(): no per-component symlink walk on every import
+REPO_ROOT = Path(os.path.dirname(os.path.abspath(__file__)))
+# Resolved once; every home-relative default below derives from it
+_HOME = Path.home()
+CLAUDE_SESSIONS_DIR = _HOME / ".claude" / "projects"
 
 # Chat history input
-CHAT_HISTORY_PATH = os.getenv("HYPERDOCS_CHAT_HISTORY", "")
+CHAT_HISTORY_PATH = _ENV.get("HYPERDOCS_CHAT_HISTORY", "")
 
 # Canonical chat history directory (all sessions, never deleted)
-CHAT_HISTORY_DIR = Path(os.getenv(
+CHAT_HISTORY_DIR = Path(_ENV.get(
     "HYPERDOCS_CHAT_HISTORY_DIR",
-    str(Path.home() / "PERMANENT_CHAT_HISTORY" / "sessions")
+    str(_HOME / "PERMANENT_CHAT_HISTORY" / "sessions")
 ))
 
 # Output directory
-OUTPUT_DIR = Path(os.getenv("HYPERDOCS_OUTPUT_DIR", str(REPO_ROOT / "output")))
+OUTPUT_DIR = Path(_ENV.get("HYPERDOCS_OUTPUT_DIR", str(REPO_ROOT / "output")))
+
+# Per-session output directory; get_session_output_dir() creates it on first use.
+# The str form is for callers that build many file paths with os.path.join.
+SESSION_OUTPUT_STR = os.path.join(OUTPUT_DIR, f"session_{SESSION_SHORT}" if SESSION_SHORT else "session")
+SESSION_OUTPUT_DIR = Path(SESSION_OUTPUT_STR)
 
 # PERMANENT_ARCHIVE (optional, for bulk processing)
-ARCHIVE_PATH = os.getenv("HYPERDOCS_ARCHIVE_PATH", "")
+ARCHIVE_PATH = _ENV.get("HYPERDOCS_ARCHIVE_PATH", "")
 
 # Claude Code project identifier (for session file lookup)
-PROJECT_ID = os.getenv("HYPERDOCS_PROJECT_ID", "")
+PROJECT_ID = _ENV.get("HYPERDOCS_PROJECT_ID", "")
 
 # ── V5 Source Code Directory ──────────────────────────────────
 # Phase 4 (insertion) reads source files from disk.
 # The improved modules live directly in phase_0_prep/ (v5_compat dissolved).
-V5_SOURCE_DIR = Path(os.getenv(
+V5_SOURCE_DIR = Path(_ENV.get(
     "HYPERDOCS_V5_SOURCE",
     str(REPO_ROOT / "phase_0_prep")
 ))
 
 # ── Permanent Storage ─────────────────────────────────────────
-STORE_DIR = Path(os.getenv("HYPERDOCS_STORE_DIR", str(Path.home() / "PERMANENT_HYPERDOCS")))
+STORE_DIR = Path(_ENV.get("HYPERDOCS_STORE_DIR", str(_HOME / "PERMANENT_HYPERDOCS")))
 SESSIONS_STORE_DIR = STORE_DIR / "sessions"
 INDEXES_DIR = STORE_DIR / "indexes"
 HYPERDOCS_STORE_DIR = STORE_DIR / "hyperdocs"
 HYPERDOC_INPUTS_DIR = STORE_DIR / "hyperdoc_inputs"
-CHAT_ARCHIVE_DIR = Path(os.getenv("HYPERDOCS_CHAT_ARCHIVE", str(Path.home() / "PERMANENT_CHAT_HISTORY")))
+CHAT_ARCHIVE_DIR = Path(_ENV.get("HYPERDOCS_CHAT_ARCHIVE", str(_HOME / "PERMANENT_CHAT_HISTORY")))
 
 # ── Helpers ────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=None)
 def get_session_output_dir():
-    """Get or create the output directory for the current session."""
-    if SESSION_SHORT:
-        out = OUTPUT_DIR / f"session_{SESSION_SHORT}"
-    else:
-        out = OUTPUT_DIR / "session"
-    out.mkdir(parents=True, exist_ok=True)
-    return out
+    """Get or create the output directory for the current session.
+
+    Cached: the directory is created once per process, not on every call.
+    """
+    SESSION_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    return SESSION_OUTPUT_DIR
 
 
 def _find_jsonl(directory, session_id):
     """Find a JSONL file by exact name or prefix match in a directory."""
-    if not directory.exists():
+    # Exact match first: one stat on a plain string, no listing
+    exact = os.path.join(directory, f"{session_id}.jsonl")
+    if os.path.exists(exact):
+        return Path(exact)
+    # Prefix match (e.g., "513d4807" matches "513d4807-bea5-4a06-...-3bb9b75b8d3f.jsonl")
+    # or underscore prefix (e.g., "prefix_513d4807-uuid.jsonl"), both from one listing
+    try:
+        with os.scandir(directory) as it:
+            names = sorted(e.name for e in it if e.name.endswith(".jsonl"))
+    except OSError:
         return None
-    # Exact match first
-    exact = directory / f"{session_id}.jsonl"
-    if exact.exists():
+    name = _match_jsonl(names, session_id)
+    return Path(directory) / name if name else None
+
+
+def _match_jsonl(names, session_id):
+    """Pick a session file from a sorted list of .jsonl names, as _find_jsonl does."""
+    exact = f"{session_id}.jsonl"
+    i = bisect.bisect_left(names, exact)
+    if i < len(names) and names[i] == exact:
         return exact
-    # Prefix match (e.g., "513d4807" matches "513d4807-bea5-4a06-...-3bb9b75b8d3f.jsonl")
-    matches = sorted(directory.glob(f"{session_id}*.jsonl"))
-    if matches:
-        return matches[0]
-    # Also check with underscore prefix (e.g., "prefix_513d4807-uuid.jsonl")
-    matches = sorted(directory.glob(f"*_{session_id}*.jsonl"))
-    if matches:
-        return matches[0]
+    i = bisect.bisect_left(names, session_id)
+    if i < len(names) and names[i].startswith(session_id):
+        return names[i]
+    marker = f"_{session_id}"
+    for name in names:
+        if marker in name[:-len(".jsonl")]:
+            return name
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_session_file():
-    """Find the JSONL chat history file."""
-    if CHAT_HISTORY_PATH:
-        p = Path(CHAT_HISTORY_PATH)
-        if p.exists():
-            return p
+    """Find the JSONL chat history file.
+
+    Cached, since the fallback scans every project directory. Call
+    get_session_file.cache_clear() if the file may have appeared since.
+    """
+    # Direct hits are tested on plain strings; a Path is built only to return
+    if CHAT_HISTORY_PATH and os.path.exists(CHAT_HISTORY_PATH):
+        return Path(CHAT_HISTORY_PATH)
 
     if SESSION_ID and PROJECT_ID:
+        # _find_jsonl tries the exact {SESSION_ID}.jsonl path first
         result = _find_jsonl(CLAUDE_SESSIONS_DIR / PROJECT_ID, SESSION_ID)
         if result:
             return result
@@ -118,14 +174,22 @@ def get_session_file():
         if result:
             return result
 
-    # Search all project directories
+    # Search all project directories; DirEntry.is_dir() reads the type from
+    # the directory listing, stat()ing only symlinks
     if SESSION_ID and CLAUDE_SESSIONS_DIR.exists():
-        for project_dir in CLAUDE_SESSIONS_DIR.iterdir():
-            if not project_dir.is_dir():
+        with os.scandir(CLAUDE_SESSIONS_DIR) as it:
+            project_dirs = [e.path for e in it if e.is_dir()]
+        for project_dir in project_dirs:
+            # One listing per project answers the exact, prefix and
+            # underscore-prefix lookups that _find_jsonl makes separately
+            try:
+                with os.scandir(project_dir) as it:
+                    names = sorted(e.name for e in it if e.name.endswith(".jsonl"))
+            except OSError:
                 continue
-            result = _find_jsonl(project_dir, SESSION_ID)
-            if result:
-                return result
+            name = _match_jsonl(names, SESSION_ID)
+            if name:
+                return Path(project_dir) / name
 
     return None
 
@@ -44,6 +44,8 @@ from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import redirect_stdout
 
+import anthropic
+
 # ── Path setup ────────────────────────────────────────────────────────
 REPO = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO))
@@ -160,7 +162,9 @@ def _run_pass_worker(session_dir, pass_num, pass1_results=None, dry_run=False):
             "messages_analyzed": result.get("messages_analyzed", 0),
         }
 
-    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+    # anthropic.APIError: call_api gave up on a rate limit or server error
+    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError,
+            anthropic.APIError) as e:
         return {
             "session": session_name,
             "status": "error",
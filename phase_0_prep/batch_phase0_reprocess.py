@@ -17,25 +17,67 @@ import sys
 import json
 import subprocess
 import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from phase_0_prep.phase0_child import PHASE0_STEPS, phase0_child_source
+from tools.file_lock import atomic_json_write
 from tools.log_config import get_logger
 
 logger = get_logger("phase0.batch_phase0_reprocess")
 
 REPO = Path(__file__).resolve().parent.parent  # hyperdocs_3 root
 try:
-    from config import CHAT_ARCHIVE_DIR, SESSIONS_STORE_DIR
+    from config import CHAT_ARCHIVE_DIR, SESSIONS_STORE_DIR, INDEXES_DIR
     CHAT_DIR = CHAT_ARCHIVE_DIR / "sessions"
     OUTPUT_DIR = SESSIONS_STORE_DIR
 except ImportError:
     CHAT_DIR = Path(os.getenv("HYPERDOCS_CHAT_ARCHIVE", str(Path.home() / "PERMANENT_CHAT_HISTORY"))) / "sessions"
     _STORE = Path(os.getenv("HYPERDOCS_STORE_DIR", str(Path.home() / "PERMANENT_HYPERDOCS")))
     OUTPUT_DIR = _STORE / "sessions"
+    INDEXES_DIR = _STORE / "indexes"
 
-def _build_duplicate_set():
+# Cached result of the CHAT_DIR scan, reused while the directory is unchanged
+CHAT_INDEX_CACHE = INDEXES_DIR / "duplicate_skip_ids.json"
+
+# Sessions reprocessed at once (each one is a child interpreter)
+MAX_WORKERS = os.cpu_count() or 4
+
+
+def _scan_chat_dir():
+    """Walk CHAT_DIR once and index its JSONL files.
+
+    Returns (uuid_files, jsonl_by_short):
+      uuid_files      UUID -> list of {prefix, short, file} for every JSONL
+                      holding that conversation (input to _build_duplicate_set)
+      jsonl_by_short  first-8-char short ID -> source JSONL path. When two
+                      files share a short ID the un-prefixed (UUID only) one wins.
+    """
+    uuid_files = {}
+    jsonl_by_short = {}
+    with os.scandir(CHAT_DIR) as it:
+        entries = sorted((e for e in it if e.name.endswith(".jsonl")), key=lambda e: e.name)
+    for entry in entries:
+        stem = entry.name[:-len(".jsonl")]
+        short = stem[:8]
+        if '_' in stem and not stem.startswith('agent-'):
+            prefix, uuid_part = stem.split('_', 1)
+        else:
+            prefix = None
+            uuid_part = stem
+
+        uuid_files.setdefault(uuid_part, []).append({'prefix': prefix, 'short': short, 'file': entry.name})
+        if short not in jsonl_by_short or prefix is None:
+            jsonl_by_short[short] = Path(entry.path)
+
+    return uuid_files, jsonl_by_short
+
+
+def _build_duplicate_set(uuid_files):
     """Identify duplicate session directories that process the same conversation.
 
     The chat history archive often has two JSONL files for the same conversation:
@@ -49,24 +91,9 @@ def _build_duplicate_set():
     We keep the session directory whose short ID matches the UUID (the canonical one)
     and skip the one whose short ID is just the prefix.
 
+    Takes the UUID -> files map from _scan_chat_dir().
     Returns a set of short IDs (first 8 chars of session dir name) to skip.
     """
-    # Map UUID -> list of JSONL files that contain it
-    uuid_files = {}
-    for f in CHAT_DIR.iterdir():
-        if f.suffix != ".jsonl":
-            continue
-        stem = f.stem
-        if '_' in stem and not stem.startswith('agent-'):
-            prefix, uuid_part = stem.split('_', 1)
-        else:
-            prefix = None
-            uuid_part = stem
-
-        if uuid_part not in uuid_files:
-            uuid_files[uuid_part] = []
-        uuid_files[uuid_part].append({'prefix': prefix, 'short': f.stem[:8], 'file': f.name})
-
     # For UUIDs with 2+ files, skip the prefixed version
     # (keep the one whose short ID matches the UUID start)
     skip_ids = set()
@@ -81,18 +108,53 @@ def _build_duplicate_set():
 
     return skip_ids
 
-DUPLICATE_SKIP_IDS = _build_duplicate_set()
 
+def _chat_dir_fingerprint():
+    """Cheap change marker for CHAT_DIR: its own mtime.
 
-def find_jsonl_for_session(session_dir_name):
-    """Find the source JSONL file for a session directory."""
-    short_id = session_dir_name.replace("session_", "")
-    for f in CHAT_DIR.iterdir():
-        if f.suffix == ".jsonl" and f.stem.startswith(short_id):
-            return f
-    return None
+    Adding, removing or renaming an entry updates a directory's mtime, and
+    the duplicate set and short-ID lookup depend only on the file names, so
+    one stat stands in for a full walk.
+    """
+    return os.stat(CHAT_DIR).st_mtime_ns
 
 
+def load_chat_index():
+    """Return (duplicate_skip_ids, jsonl_by_short), from cache when CHAT_DIR is unchanged.
+
+    The cache lives in INDEXES_DIR/duplicate_skip_ids.json, keyed by
+    _chat_dir_fingerprint(); on a miss CHAT_DIR is scanned and the cache
+    rewritten atomically.
+    """
+    fingerprint = _chat_dir_fingerprint()
+    try:
+        with open(CHAT_INDEX_CACHE) as f:
+            cached = json.load(f)
+        if cached.get("fingerprint") == fingerprint and cached.get("chat_dir") == str(CHAT_DIR):
+            jsonl_by_short = {short: CHAT_DIR / name
+                              for short, name in cached["jsonl_by_short"].items()}
+            return set(cached["skip_ids"]), jsonl_by_short
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    uuid_files, jsonl_by_short = _scan_chat_dir()
+    skip_ids = _build_duplicate_set(uuid_files)
+    try:
+        atomic_json_write(CHAT_INDEX_CACHE, {
+            "chat_dir": str(CHAT_DIR),
+            "fingerprint": fingerprint,
+            "skip_ids": sorted(skip_ids),
+            "jsonl_by_short": {short: p.name for short, p in jsonl_by_short.items()},
+        })
+    except OSError as e:
+        logger.warning(f"Could not write {CHAT_INDEX_CACHE.name}: {e}")
+    return skip_ids, jsonl_by_short
+
+
+# Both Phase 0 scripts run in one child interpreter per session (see
+# phase_0_prep/phase0_child.py); the source is the same for every session
+_PHASE0_CHILD = phase0_child_source()
+
 def run_phase0(session_id, jsonl_path, output_dir):
     """Run enrich_session.py + prepare_agent_data.py for one session."""
     env = os.environ.copy()
@@ -100,25 +162,41 @@ def run_phase0(session_id, jsonl_path, output_dir):
     env["HYPERDOCS_CHAT_HISTORY"] = str(jsonl_path)
     env["HYPERDOCS_OUTPUT_DIR"] = str(output_dir.parent)
 
-    # Run enrich_session.py
     result = subprocess.run(
-        [sys.executable, str(REPO / "phase_0_prep" / "enrich_session.py")],
-        env=env, capture_output=True, text=True, timeout=120
+        [sys.executable, "-c", _PHASE0_CHILD],
+        env=env, capture_output=True, text=True, timeout=240
     )
     if result.returncode != 0:
-        return False, f"enrich_session failed: {result.stderr[:200]}"
-
-    # Run prepare_agent_data.py
-    result2 = subprocess.run(
-        [sys.executable, str(REPO / "phase_0_prep" / "prepare_agent_data.py")],
-        env=env, capture_output=True, text=True, timeout=120
-    )
-    if result2.returncode != 0:
-        return False, f"prepare_agent_data failed: {result2.stderr[:200]}"
+        step = PHASE0_STEPS.get(result.returncode, "phase0")
+        return False, f"{step} failed: {result.stderr[-200:]}"
 
     return True, "ok"
 
 
+def run_tail(cmd, timeout, keep=50):
+    """Run a child script and return only the last `keep` lines of its stdout.
+
+    Output is streamed through a ring buffer instead of captured whole, so a
+    chatty scanner cannot grow this process's memory; stderr is discarded.
+    The child is killed if it runs past `timeout` seconds.
+    """
+    buf = deque(maxlen=keep)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                          text=True, bufsize=1) as proc:
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                buf.append(line)
+            proc.wait()
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+    if timed_out and proc.returncode != 0:
+        logger.error(f"  {Path(cmd[-1]).name} killed after {timeout}s")
+    return "".join(buf)
+
+
 def main():
     start_time = time.time()
     logger.info("=" * 70)
@@ -127,10 +205,17 @@ def main():
     logger.info("=" * 70)
 
     # Get all session directories that have enriched_session.json
-    session_dirs = sorted(
-        d for d in OUTPUT_DIR.iterdir()
-        if d.is_dir() and d.name.startswith("session_") and (d / "enriched_session.json").exists()
-    )
+    with os.scandir(OUTPUT_DIR) as it:
+        entries = sorted((e for e in it if e.name.startswith("session_") and e.is_dir()),
+                         key=lambda e: e.name)
+    session_dirs = [
+        Path(e.path) for e in entries
+        if os.path.exists(os.path.join(e.path, "enriched_session.json"))
+    ]
+
+    # One CHAT_DIR walk (or none, if cached) serves both the duplicate check
+    # and the JSONL lookup
+    duplicate_skip_ids, jsonl_by_short = load_chat_index()
 
     logger.info(f"Sessions to reprocess: {len(session_dirs)}")
     logger.info("")
@@ -140,57 +225,63 @@ def main():
     skipped = 0
     errors = []
 
-    for i, sd in enumerate(session_dirs):
-        session_name = sd.name
-        short_id = session_name.replace("session_", "")
+    tasks = []
+    for sd in session_dirs:
+        short_id = sd.name.replace("session_", "")
 
         # Skip duplicate sessions (same conversation stored under two filenames)
-        if short_id in DUPLICATE_SKIP_IDS:
+        if short_id in duplicate_skip_ids:
             skipped += 1
             continue
 
         # Find source JSONL
-        jsonl = find_jsonl_for_session(session_name)
+        jsonl = jsonl_by_short.get(short_id)
         if not jsonl:
             skipped += 1
             continue
-
-        try:
-            ok, msg = run_phase0(short_id, jsonl, sd)
-            if ok:
-                success += 1
-            else:
+        tasks.append((short_id, jsonl, sd))
+
+    # Each session already runs in its own child interpreter, so threads are
+    # enough to keep every core busy without a second layer of processes.
+    total = len(tasks)
+    done = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(run_phase0, *task): task[2].name for task in tasks}
+        for future in as_completed(futures):
+            session_name = futures[future]
+            try:
+                ok, msg = future.result()
+                if ok:
+                    success += 1
+                else:
+                    failed += 1
+                    errors.append((session_name, msg))
+            except subprocess.TimeoutExpired:
+                failed += 1
+                errors.append((session_name, "timeout"))
+            except (subprocess.SubprocessError, OSError) as e:
                 failed += 1
-                errors.append((session_name, msg))
-        except subprocess.TimeoutExpired:
-            failed += 1
-            errors.append((session_name, "timeout"))
-        except (subprocess.SubprocessError, OSError) as e:
-            failed += 1
-            errors.append((session_name, str(e)))
-
-        # Progress every 25 sessions
-        if (i + 1) % 25 == 0 or (i + 1) == len(session_dirs):
-            elapsed = time.time() - start_time
-            rate = (i + 1) / elapsed if elapsed > 0 else 0
-            remaining = (len(session_dirs) - i - 1) / rate if rate > 0 else 0
-            print(f"  [{i+1}/{len(session_dirs)}] success={success} failed={failed} skipped={skipped} "
-                  f"({elapsed:.0f}s elapsed, ~{remaining:.0f}s remaining)")
+                errors.append((session_name, str(e)))
+
+            # Progress every 25 sessions
+            done += 1
+            if done % 25 == 0 or done == total:
+                elapsed = time.time() - start_time
+                rate = done / elapsed if elapsed > 0 else 0
+                remaining = (total - done) / rate if rate > 0 else 0
+                print(f"  [{done}/{total}] success={success} failed={failed} skipped={skipped} "
+                      f"({elapsed:.0f}s elapsed, ~{remaining:.0f}s remaining)")
+
+    errors.sort()
 
     # ── Run schema normalizer ──
     logger.info("\nRunning schema normalizer...")
-    subprocess.run(
-        [sys.executable, str(REPO / "phase_0_prep" / "schema_normalizer.py")],
-        capture_output=True, text=True, timeout=600
-    )
+    run_tail([sys.executable, str(REPO / "phase_0_prep" / "schema_normalizer.py")], timeout=600)
 
     # ── Run completeness scanner ──
     logger.info("Running completeness scanner...")
-    result = subprocess.run(
-        [sys.executable, str(REPO / "phase_0_prep" / "completeness_scanner.py")],
-        capture_output=True, text=True, timeout=300
-    )
-    logger.info(result.stdout[-500:] if result.stdout else "")
+    tail = run_tail([sys.executable, str(REPO / "phase_0_prep" / "completeness_scanner.py")], timeout=300)
+    logger.info(tail[-500:])
 
     elapsed = time.time() - start_time
 
@@ -203,13 +294,8 @@ def main():
         "sessions_skipped": skipped,
         "errors": [{"session": s, "error": e} for s, e in errors],
     }
-    try:
-        from config import INDEXES_DIR as _IDX
-        log_path = _IDX / "phase0_reprocess_log.json"
-    except ImportError:
-        log_path = Path(os.getenv("HYPERDOCS_STORE_DIR", str(Path.home() / "PERMANENT_HYPERDOCS"))) / "indexes" / "phase0_reprocess_log.json"
-    with open(log_path, "w") as f:
-        json.dump(log, f, indent=2)
+    log_path = INDEXES_DIR / "phase0_reprocess_log.json"
+    atomic_json_write(log_path, log)
 
     logger.info("")
     logger.info("=" * 70)
@@ -20,34 +20,59 @@ OPUS READS AND UNDERSTANDS. Python handles file I/O.
 #FRAGILE: Relies on Opus returning valid JSON from freeform prompt - no schema validation, silent fallback to None on parse failure
 
 
+import heapq
 import json
+import os
+import sys
+from collections import defaultdict
 import anthropic
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Iterator, List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# orjson.loads takes str or bytes and raises orjson.JSONDecodeError, a
+# json.JSONDecodeError subclass, so callers catch the same exceptions.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# One GeologicalMessage per parsed line: __slots__ drops the per-instance
+# __dict__. dataclass(slots=True) needs 3.10+; older interpreters get plain
+# dataclasses.
+_DC_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Load .env file — walk up from current location until we find one
 from dotenv import load_dotenv
-import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from tools.log_config import get_logger
 
 logger = get_logger("phase0.geological_reader")
-_search = Path(__file__).resolve().parent
-for _ in range(10):
-    if (_search / ".env").exists():
-        load_dotenv(_search / ".env")
-        break
-    _search = _search.parent
-else:
-    load_dotenv()  # Try default locations
+# The sentinel is inherited by child processes (pool workers, subprocess
+# pipeline stages), which already have the variables and skip the walk.
+if not os.environ.get("_HYPERDOCS_ENV_LOADED"):
+    _search = Path(__file__).resolve().parent
+    for _ in range(10):
+        if (_search / ".env").exists():
+            load_dotenv(_search / ".env")
+            break
+        _search = _search.parent
+    else:
+        load_dotenv()  # Try default locations
+    os.environ["_HYPERDOCS_ENV_LOADED"] = "1"
 
 client = anthropic.Anthropic()
 
 # API call logging for viewer visibility
-API_CALL_LOG_FILE = Path(__file__).parent / "api_call_log.json"
+# One JSON object per line: each call is a single O_APPEND write, with no
+# read-parse-rewrite of the whole history (and no torn JSON array when two
+# processes log at once).
+API_CALL_LOG_FILE = Path(__file__).parent / "api_call_log.jsonl"
 
 def log_api_call(call_type: str, prompt: str, system: str = "", response: str = "", status: str = "pending"):
     """Log API calls so the viewer can show what's happening."""
@@ -63,16 +88,14 @@ def log_api_call(call_type: str, prompt: str, system: str = "", response: str =
         "response_length": len(response) if response else 0,
     }
 
+    if orjson is not None:
+        line = orjson.dumps(log_entry) + b"\n"
+    else:
+        line = (json.dumps(log_entry, ensure_ascii=False) + "\n").encode("utf-8")
     try:
-        if API_CALL_LOG_FILE.exists():
-            with open(API_CALL_LOG_FILE) as f:
-                logs = json.load(f)
-        else:
-            logs = []
-        logs.append(log_entry)
-        with open(API_CALL_LOG_FILE, 'w') as f:
-            json.dump(logs, f, indent=2)
-    except (json.JSONDecodeError, OSError, PermissionError):
+        with open(API_CALL_LOG_FILE, 'ab') as f:
+            f.write(line)
+    except OSError:
         pass
 
 def call_opus(prompt: str, system: str = "", call_type: str = "geological_reader") -> str:
@@ -93,7 +116,69 @@ def call_opus(prompt: str, system: str = "", call_type: str = "geological_reader
 
     return result
 
-@dataclass
+# Timestamp for messages with a missing or unparseable stamp
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_iso_timestamp(ts: str) -> datetime:
+    """Parse a JSONL timestamp to a naive datetime.
+
+    Claude Code writes fixed-shape UTC stamps (2026-02-08T22:30:00.123Z);
+    those are sliced directly. Anything else goes through the general
+    fromisoformat path, which drops a Z/+HH:MM suffix first.
+    """
+    n = len(ts)
+    if (n == 20 or (n == 24 and ts[19] == ".")) and ts[-1] == "Z" and ts[10] == "T":
+        try:
+            return datetime(
+                int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+                int(ts[20:23]) * 1000 if n == 24 else 0,
+            )
+        except ValueError:
+            pass
+    return datetime.fromisoformat(ts.replace('Z', '+00:00').split('+')[0])
+
+
+# Smallest JSONL file worth parsing. A single real Claude Code message line
+# (uuids, cwd, timestamp, message) is well over this; smaller files are
+# aborted sessions holding nothing the parser would keep.
+MIN_JSONL_SIZE = 256
+
+# Session file name suffixes, checked with a single str.endswith per entry
+JSONL_SUFFIXES = (".jsonl",)
+
+
+def _scan_jsonl(root: Path, min_size: int = MIN_JSONL_SIZE) -> List[Path]:
+    """All JSONL files under root of at least min_size bytes, sorted.
+
+    Iterative os.scandir walk: is_dir() and the name come from the
+    directory entry, so each file costs no extra stat call (pathlib's
+    ** glob stats every entry); only name matches are stat'ed for size.
+    Symlinked directories are not followed. Each directory's matches are
+    sorted on their own and the runs combined with heapq.merge, so one
+    small sort per project directory replaces a sort of the whole archive.
+    """
+    runs = []
+    stack = [str(root)]
+    while stack:
+        found = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (entry.name.endswith(JSONL_SUFFIXES)
+                        and entry.stat(follow_symlinks=False).st_size >= min_size):
+                    found.append(Path(entry.path))
+        if found:
+            found.sort()
+            runs.append(found)
+    if len(runs) == 1:
+        return runs[0]
+    return list(heapq.merge(*runs))
+
+
+@dataclass(**_DC_SLOTS)
 class GeologicalMessage:
     """A single message from the geological record."""
     role: str
@@ -116,21 +201,146 @@ class GeologicalMessage:
             "opus_analysis": self.opus_analysis,
         }
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class GeologicalSession:
-    """A complete conversation session."""
+    """A complete conversation session.
+
+    messages may be reassigned or appended to; editing it in place any other
+    way (replacing, reordering, changing a timestamp) leaves start_time and
+    end_time stale.
+    """
     session_id: str
     source_file: str
     messages: List[GeologicalMessage] = field(default_factory=list)
     opus_summary: Optional[str] = None  # NEW: Opus's session summary
+    # Timestamp bounds over the first _bounds_len items of the list object
+    # _bounds_src, which is the messages list they were computed from
+    _min_ts: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _max_ts: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _bounds_len: int = field(default=0, init=False, repr=False, compare=False)
+    _bounds_src: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+
+    def add_message(self, message: GeologicalMessage) -> None:
+        """Append a message, keeping start_time/end_time current in O(1)."""
+        self._sync_bounds()
+        self.messages.append(message)
+        ts = message.timestamp
+        if self._min_ts is None or ts < self._min_ts:
+            self._min_ts = ts
+        if self._max_ts is None or ts > self._max_ts:
+            self._max_ts = ts
+        self._bounds_len += 1
+
+    def _sync_bounds(self) -> None:
+        """Rescan once if messages were passed in, reassigned or appended directly."""
+        if self._bounds_src is not self.messages or self._bounds_len != len(self.messages):
+            stamps = [m.timestamp for m in self.messages]
+            self._min_ts = min(stamps) if stamps else None
+            self._max_ts = max(stamps) if stamps else None
+            self._bounds_len = len(stamps)
+            self._bounds_src = self.messages
 
     @property
     def start_time(self) -> Optional[datetime]:
-        return min(m.timestamp for m in self.messages) if self.messages else None
+        self._sync_bounds()
+        return self._min_ts
 
     @property
     def end_time(self) -> Optional[datetime]:
-        return max(m.timestamp for m in self.messages) if self.messages else None
+        self._sync_bounds()
+        return self._max_ts
+
+
+# Line types the deterministic parser drops, and the roles it keeps
+_SKIP_TYPES = frozenset({"queue-operation", "system", "progress"})
+_VALID_ROLES = frozenset({"user", "assistant"})
+
+# Byte probes for rejecting non-message lines before JSON decoding. Claude
+# Code writes compact JSON, so a skipped type shows up verbatim. A nested
+# object could carry the same literal, so a hit only rejects the line when
+# no user/assistant role literal is present either (the role check below
+# would drop such a line anyway).
+_SKIP_TYPE_PROBES = (b'"type":"queue-operation"', b'"type":"system"', b'"type":"progress"')
+_ROLE_PROBES = (b'"role":"user"', b'"role":"assistant"')
+
+
+def _parse_message_line(raw_line: Union[str, bytes], session_id: str, line_idx: int,
+                        source_file: str) -> Optional["GeologicalMessage"]:
+    """Parse one JSONL line (see GeologicalReader.deterministic_parse_message)."""
+    if isinstance(raw_line, bytes):
+        if (any(probe in raw_line for probe in _SKIP_TYPE_PROBES)
+                and not any(probe in raw_line for probe in _ROLE_PROBES)):
+            return None
+
+    try:
+        msg = _json_loads(raw_line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+
+    # Skip non-message types
+    msg_type = msg.get("type", "")
+    if msg_type in _SKIP_TYPES:
+        return None
+
+    # Nested message object, bound once for the role and content fallbacks
+    message_obj = msg.get("message")
+    if not isinstance(message_obj, dict):
+        message_obj = None
+
+    # Extract role
+    role = msg.get("role") or (message_obj.get("role") if message_obj else "") or ""
+    if role not in _VALID_ROLES:
+        return None
+
+    # Extract content, thinking (first block only) and tool calls in one
+    # pass over the block list; thinking blocks are skipped for content
+    content = ""
+    thinking = None
+    tool_calls = []
+    raw_content = msg.get("content")
+    if raw_content is None and message_obj:
+        raw_content = message_obj.get("content")
+    if isinstance(raw_content, str):
+        content = raw_content
+    elif isinstance(raw_content, list):
+        text_parts = []
+        for block in raw_content:
+            if not isinstance(block, dict):
+                continue
+            block_type = block.get("type")
+            if block_type == "text":
+                text_parts.append(block.get("text", ""))
+            elif block_type == "thinking":
+                if thinking is None:
+                    thinking = block.get("thinking", block.get("text", ""))
+            elif block_type == "tool_use":
+                tool_calls.append({
+                    "name": block.get("name", ""),
+                    "input": block.get("input", {}),
+                })
+        content = " ".join(text_parts)
+
+    if not content:
+        return None
+
+    # Extract timestamp
+    ts_str = msg.get("timestamp", msg.get("createdAt", ""))
+    try:
+        timestamp = _parse_iso_timestamp(ts_str) if ts_str else _EPOCH
+    except (ValueError, TypeError, AttributeError):
+        timestamp = _EPOCH
+
+    return GeologicalMessage(
+        role=role,
+        content=content,
+        timestamp=timestamp,
+        session_id=session_id,
+        source_file=source_file,
+        message_index=line_idx,
+        message_type=msg_type or msg.get("type", "unknown"),
+        thinking=thinking,
+        tool_calls=tool_calls,
+    )
 
 
 class GeologicalReader:
@@ -152,9 +362,9 @@ class GeologicalReader:
 
     def discover_jsonl_files(self) -> List[Path]:
         """Discover all JSONL files."""
-        return sorted(self.chat_dir.glob("**/*.jsonl"))
+        return _scan_jsonl(self.chat_dir)
 
-    def deterministic_parse_message(self, raw_line: str, session_id: str, line_idx: int) -> Optional[GeologicalMessage]:
+    def deterministic_parse_message(self, raw_line: Union[str, bytes], session_id: str, line_idx: int) -> Optional[GeologicalMessage]:
         """
         Parse a JSONL message line using pure Python — no LLM calls.
 
@@ -163,79 +373,23 @@ class GeologicalReader:
         for free. User insight at msg 2272: 'the v1 actually ran and produced
         hyperdocs... we didn't add a whole llm layer.'
         """
-        try:
-            msg = json.loads(raw_line)
-        except (json.JSONDecodeError, ValueError):
-            return None
+        return _parse_message_line(raw_line, session_id, line_idx, str(self.chat_dir))
 
-        # Skip non-message types
-        msg_type = msg.get("type", "")
-        if msg_type in ("queue-operation", "system", "progress"):
-            return None
-
-        # Extract role
-        role = msg.get("role", "")
-        if not role:
-            message_obj = msg.get("message", {})
-            if isinstance(message_obj, dict):
-                role = message_obj.get("role", "")
-        if role not in ("user", "assistant"):
-            return None
-
-        # Extract content
-        content = ""
-        raw_content = msg.get("content", msg.get("message", {}).get("content", ""))
-        if isinstance(raw_content, str):
-            content = raw_content
-        elif isinstance(raw_content, list):
-            text_parts = []
-            for block in raw_content:
-                if isinstance(block, dict):
-                    if block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                    elif block.get("type") == "thinking":
-                        pass  # Skip thinking blocks for content
-            content = " ".join(text_parts)
-
-        if not content:
-            return None
-
-        # Extract timestamp
-        ts_str = msg.get("timestamp", msg.get("createdAt", ""))
-        try:
-            timestamp = datetime.fromisoformat(ts_str.replace('Z', '+00:00').split('+')[0]) if ts_str else datetime(1970, 1, 1)
-        except (ValueError, TypeError, AttributeError):
-            timestamp = datetime(1970, 1, 1)
-
-        # Extract thinking
-        thinking = None
-        if isinstance(raw_content, list):
-            for block in raw_content:
-                if isinstance(block, dict) and block.get("type") == "thinking":
-                    thinking = block.get("thinking", block.get("text", ""))
-                    break
+    def iter_messages(self, path: Path, session_id: str) -> Iterator[GeologicalMessage]:
+        """
+        Yield parsed messages from one JSONL file, one line at a time.
 
-        # Extract tool calls
-        tool_calls = []
-        if isinstance(raw_content, list):
-            for block in raw_content:
-                if isinstance(block, dict) and block.get("type") == "tool_use":
-                    tool_calls.append({
-                        "name": block.get("name", ""),
-                        "input": block.get("input", {}),
-                    })
-
-        return GeologicalMessage(
-            role=role,
-            content=content,
-            timestamp=timestamp,
-            session_id=session_id,
-            source_file=str(self.chat_dir),
-            message_index=line_idx,
-            message_type=msg_type or msg.get("type", "unknown"),
-            thinking=thinking,
-            tool_calls=tool_calls,
-        )
+        Only the current line is held in memory, so counts and other
+        aggregations over huge sessions never build a message list.
+        Callers that need the list use list(reader.iter_messages(...)).
+        """
+        source = str(self.chat_dir)
+        with open(path, 'rb') as f:
+            for line_idx, line in enumerate(f):
+                if line.strip():
+                    msg = _parse_message_line(line, session_id, line_idx, source)
+                    if msg:
+                        yield msg
 
     # ── DEPRECATED: Opus-per-line methods ──────────────────────────────────
     # These methods called Opus API per message line at ~$0.05/line.
@@ -289,13 +443,7 @@ def main():
 
     if files:
         # Parse first file using deterministic method
-        count = 0
-        with open(files[0], 'r', encoding='utf-8', errors='ignore') as f:
-            for line_idx, line in enumerate(f):
-                if line.strip():
-                    msg = reader.deterministic_parse_message(line, files[0].stem, line_idx)
-                    if msg:
-                        count += 1
+        count = sum(1 for _ in reader.iter_messages(files[0], files[0].stem))
         logger.info(f"Parsed {count} messages from {files[0].name} (deterministic, $0)")
 
 if __name__ == "__main__":
@@ -717,7 +865,7 @@ if __name__ == "__main__":
 
 
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class GeologicalMessage:
     """
     A single message from the geological record.
@@ -751,26 +899,58 @@ class GeologicalMessage:
         }
 
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class GeologicalSession:
     """
     A complete conversation session - one contiguous geological layer.
+
+    messages may be reassigned or appended to; editing it in place any other
+    way (replacing, reordering, changing a timestamp) leaves start_time and
+    end_time stale.
     """
     session_id: str
     source_file: str
     messages: List[GeologicalMessage] = field(default_factory=list)
+    # Timestamp bounds over the first _bounds_len items of the list object
+    # _bounds_src, which is the messages list they were computed from
+    _min_ts: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _max_ts: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _bounds_len: int = field(default=0, init=False, repr=False, compare=False)
+    _bounds_src: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+
+    def add_message(self, message: GeologicalMessage) -> None:
+        """Append a message, keeping start_time/end_time current in O(1)."""
+        self._sync_bounds()
+        self.messages.append(message)
+        ts = message.timestamp
+        if self._min_ts is None or ts < self._min_ts:
+            self._min_ts = ts
+        if self._max_ts is None or ts > self._max_ts:
+            self._max_ts = ts
+        self._bounds_len += 1
+
+    def _sync_bounds(self) -> None:
+        """
+        Recompute the bounds with one scan when messages were supplied to
+        the constructor, reassigned, or appended directly instead of via
+        add_message.
+        """
+        if self._bounds_src is not self.messages or self._bounds_len != len(self.messages):
+            stamps = [m.timestamp for m in self.messages]
+            self._min_ts = min(stamps) if stamps else None
+            self._max_ts = max(stamps) if stamps else None
+            self._bounds_len = len(stamps)
+            self._bounds_src = self.messages
 
     @property
     def start_time(self) -> Optional[datetime]:
-        if self.messages:
-            return min(m.timestamp for m in self.messages)
-        return None
+        self._sync_bounds()
+        return self._min_ts
 
     @property
     def end_time(self) -> Optional[datetime]:
-        if self.messages:
-            return max(m.timestamp for m in self.messages)
-        return None
+        self._sync_bounds()
+        return self._max_ts
 
     @property
     def duration_minutes(self) -> float:
@@ -824,24 +1004,23 @@ class GeologicalReader:
     def discover_jsonl_files(self) -> List[Path]:
         """Discover all JSONL files in the chat directory."""
         if self._jsonl_files is None:
-            self._jsonl_files = sorted(self.chat_dir.glob("**/*.jsonl"))
+            self._jsonl_files = _scan_jsonl(self.chat_dir)
         return self._jsonl_files
 
-    def _parse_timestamp(self, raw: Any) -> datetime:
+    @staticmethod
+    def _parse_timestamp(raw: Any) -> datetime:
         """Parse various timestamp formats found in JSONL files."""
         if isinstance(raw, datetime):
             return raw
         if isinstance(raw, str):
             try:
-                clean = raw.replace('Z', '+00:00')
-                if '+' in clean:
-                    clean = clean.split('+')[0]
-                return datetime.fromisoformat(clean)
+                return _parse_iso_timestamp(raw)
             except (ValueError, TypeError, AttributeError):
                 pass
-        return datetime(1970, 1, 1)
+        return _EPOCH
 
-    def _extract_message_content(self, msg: Dict) -> Tuple[str, Optional[str], List[Dict]]:
+    @staticmethod
+    def _extract_message_content(msg: Dict) -> Tuple[str, Optional[str], List[Dict]]:
         """
         Extract content, thinking, and tool calls from a message.
         Returns tuple of (content, thinking, tool_calls).
@@ -878,8 +1057,17 @@ class GeologicalReader:
 
     def _parse_jsonl_file(self, file_path: Path) -> List[GeologicalMessage]:
         """Parse a single JSONL file into geological messages."""
-        messages = []
+        return list(self._iter_jsonl_file(file_path))
+
+    @staticmethod
+    def _iter_jsonl_file(file_path: Path) -> Iterator[GeologicalMessage]:
+        """
+        Yield geological messages from a single JSONL file as each line is
+        parsed, for callers that aggregate without keeping the list.
 
+        Static (it reads no reader state) so process-pool workers can call
+        it without constructing a reader; see _read_file_messages.
+        """
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 for line_idx, line in enumerate(f):
@@ -896,16 +1084,16 @@ class GeologicalReader:
                     if msg_type == "queue-operation":
                         continue
 
-                    timestamp = self._parse_timestamp(msg.get("timestamp"))
+                    timestamp = GeologicalReader._parse_timestamp(msg.get("timestamp"))
 
                     role = msg.get("type", "unknown")
                     if "message" in msg and isinstance(msg["message"], dict):
                         role = msg["message"].get("role", role)
 
-                    if role not in ("user", "assistant"):
+                    if role not in _VALID_ROLES:
                         continue
 
-                    content, thinking, tool_calls = self._extract_message_content(msg)
+                    content, thinking, tool_calls = GeologicalReader._extract_message_content(msg)
 
                     if not content:
                         continue
@@ -923,13 +1111,11 @@ class GeologicalReader:
                         thinking=thinking,
                         tool_calls=tool_calls,
                     )
-                    messages.append(geo_msg)
+                    yield geo_msg
 
         except (json.JSONDecodeError, KeyError, TypeError, ValueError, UnicodeDecodeError, OSError) as e:
             print(f"[geological_reader] Error parsing {file_path.name}: {e}")
 
-        return messages
-
     def load_all_sessions(self, limit: Optional[int] = None) -> Dict[str, GeologicalSession]:
         """
         Load all sessions from JSONL files.
@@ -946,17 +1132,17 @@ class GeologicalReader:
 
         print(f"[geological_reader] Loading {len(files)} JSONL files...")
 
-        all_messages = []
-        for i, file_path in enumerate(files):
+        # Each file's messages go straight into their session buckets; no
+        # intermediate list of every message across the archive
+        message_count = 0
+        sessions_dict = defaultdict(list)
+        for i, messages in enumerate(self._map_files(files)):
             if (i + 1) % 500 == 0:
                 print(f"[geological_reader] Processed {i + 1}/{len(files)} files...")
 
-            messages = self._parse_jsonl_file(file_path)
-            all_messages.extend(messages)
-
-        sessions_dict = defaultdict(list)
-        for msg in all_messages:
-            sessions_dict[msg.session_id].append(msg)
+            for msg in messages:
+                sessions_dict[msg.session_id].append(msg)
+            message_count += len(messages)
 
         for session_id, messages in sessions_dict.items():
             messages.sort(key=lambda m: m.timestamp)
@@ -968,9 +1154,32 @@ class GeologicalReader:
             )
             self._sessions[session_id] = session
 
-        print(f"[geological_reader] Loaded {len(all_messages)} messages in {len(self._sessions)} sessions")
+        print(f"[geological_reader] Loaded {message_count} messages in {len(self._sessions)} sessions")
         return self._sessions
 
+    def _map_files(self, files: List[Path]) -> Iterator[List[GeologicalMessage]]:
+        """
+        Every file's message list, in the order of files.
+
+        Files are independent and parsing is CPU-bound JSON decoding, so
+        more than one file is spread over a process pool.
+        """
+        if len(files) <= 1:
+            yield from map(_read_file_messages, files)
+            return
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            yield from executor.map(_read_file_messages, files, chunksize=4)
+
+    def parse_all_files(self, files: List[Path]) -> List[GeologicalSession]:
+        """
+        Parse whole JSONL files in parallel, one GeologicalSession per file
+        (named after the file stem), in the order of files.
+        """
+        return [
+            GeologicalSession(session_id=path.stem, source_file=str(path), messages=messages)
+            for path, messages in zip(files, self._map_files(files))
+        ]
+
     def get_sessions_chronologically(self) -> List[GeologicalSession]:
         """Get all sessions sorted by start time (oldest first)."""
         sessions = self.load_all_sessions()
@@ -1031,6 +1240,11 @@ class GeologicalReader:
         }
 
 
+def _read_file_messages(file_path: Path) -> List[GeologicalMessage]:
+    """Process-pool worker: every message in one JSONL file."""
+    return list(GeologicalReader._iter_jsonl_file(file_path))
+
+
 def test_reader():
     """Test the geological reader with the chat history copy."""
     print("\n" + "=" * 60)
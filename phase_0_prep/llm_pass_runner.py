@@ -22,12 +22,14 @@ Usage:
 import os
 import sys
 import json
+import atexit
 import time
 import argparse
 import re
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional, Tuple
+from tools.file_lock import atomic_json_dump
 from tools.log_config import get_logger
 
 logger = get_logger("phase0.llm_pass_runner")
@@ -54,7 +56,23 @@ for env_path in ENV_CANDIDATES:
         break  # use first found
 
 import anthropic
-client = anthropic.Anthropic()
+import httpx
+
+# One client is shared by every worker thread that batch_p1_llm runs
+# in-process: the SDK's httpx pool is thread-safe, so a pooled connection
+# (and its TLS handshake) is reused across threads and passes. httpx drops
+# idle connections after 5s by default, which gaps between a thread's calls
+# (prompt building, rate-limit waits) routinely exceed; keep them longer.
+KEEPALIVE_CONNECTIONS = 100
+KEEPALIVE_EXPIRY = 60.0
+client = anthropic.Anthropic(
+    http_client=anthropic.DefaultHttpxClient(
+        limits=httpx.Limits(max_connections=1000,
+                            max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+                            keepalive_expiry=KEEPALIVE_EXPIRY),
+    ),
+)
+atexit.register(client.close)
 
 from config import OUTPUT_DIR as DEFAULT_OUTPUT_DIR
 
@@ -264,13 +282,24 @@ def parse_json_response(text: str) -> List[Dict]:
 
 
 def call_api(model: str, system_prompt: str, user_prompt: str,
-             batch_num: int = 0, total_batches: int = 0) -> Tuple[List[Dict], Dict]:
+             batch_num: int = 0, total_batches: int = 0,
+             quiet: bool = False) -> Tuple[List[Dict], Dict]:
     """Call the Anthropic API with retry logic.
 
+    quiet sends the per-attempt progress lines to logger.debug instead of
+    stdout (see run_pass).
+
+    Raises:
+        anthropic.RateLimitError, anthropic.APIError: still failing after
+            MAX_RETRIES attempts; transient errors propagate so the pass is
+            not written out and recorded as complete with no results
+
     Returns:
         (parsed_results, usage_dict)
     """
-    usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "retries": 0}
+    usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "retries": 0,
+             "rate_limited": 0}
+    say = logger.debug if quiet else print
 
     for attempt in range(MAX_RETRIES):
         try:
@@ -293,7 +322,7 @@ def call_api(model: str, system_prompt: str, user_prompt: str,
             results = parse_json_response(response_text)
 
             if not results:
-                print(f"    WARNING: Empty/unparseable response for batch {batch_num}. "
+                say(f"    WARNING: Empty/unparseable response for batch {batch_num}. "
                       f"Response preview: {response_text[:200]}")
                 usage["retries"] = attempt + 1
                 if attempt < MAX_RETRIES - 1:
@@ -304,8 +333,12 @@ def call_api(model: str, system_prompt: str, user_prompt: str,
 
         except anthropic.RateLimitError as e:
             usage["retries"] = attempt + 1
+            usage["rate_limited"] += 1
+            if attempt == MAX_RETRIES - 1:
+                logger.error(f"    Still rate limited after {MAX_RETRIES} attempts (batch {batch_num}/{total_batches})")
+                raise
             wait = RETRY_DELAY_BASE * (2 ** attempt)
-            print(f"    Rate limited (batch {batch_num}/{total_batches}). "
+            say(f"    Rate limited (batch {batch_num}/{total_batches}). "
                   f"Waiting {wait}s... (attempt {attempt + 1}/{MAX_RETRIES})")
             time.sleep(wait)
 
@@ -326,7 +359,7 @@ def call_api(model: str, system_prompt: str, user_prompt: str,
                 time.sleep(wait)
             else:
                 logger.error(f"    FAILED after {MAX_RETRIES} attempts: {e}")
-                return [], usage
+                raise
 
     return [], usage
 
@@ -335,7 +368,7 @@ def call_api(model: str, system_prompt: str, user_prompt: str,
 
 def run_pass(pass_num: int, session_dir: Path, data: Dict,
              pass1_results: Optional[Dict] = None,
-             dry_run: bool = False) -> Dict:
+             dry_run: bool = False, quiet: bool = False) -> Dict:
     """Run a single LLM pass on a session.
 
     Args:
@@ -344,6 +377,8 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
         data: Loaded enriched_session.json
         pass1_results: Results from Pass 1 (needed for Pass 3)
         dry_run: If True, show what would be processed but don't call API
+        quiet: If True, per-batch progress goes to logger.debug instead of
+            stdout, so concurrent callers keep their own progress output
 
     Returns:
         Dict with results, usage, and metadata
@@ -351,6 +386,7 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
     config = PASS_CONFIGS[pass_num]
     messages = data.get("messages", [])
     session_id = data.get("session_id", "unknown")
+    say = logger.debug if quiet else print
 
     logger.info(f"\n  Pass {pass_num}: {config['name']}")
     logger.info(f"    Model: {config['model']}")
@@ -376,7 +412,7 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
         est_input_tokens = int(total_chars / CHARS_PER_TOKEN) + 2000  # overhead
         est_output_tokens = len(filtered) * 200  # ~200 tokens per result
         est_cost = estimate_cost(config["model"], est_input_tokens, est_output_tokens)
-        print(f"    [DRY RUN] Estimated: ~{est_input_tokens:,} input tokens, "
+        say(f"    [DRY RUN] Estimated: ~{est_input_tokens:,} input tokens, "
               f"~{est_output_tokens:,} output tokens, ~${est_cost:.3f}")
         return {
             "pass": pass_num,
@@ -394,7 +430,8 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
 
     # Process each batch
     all_results = []
-    total_usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "api_calls": 0}
+    total_usage = {"input_tokens": 0, "output_tokens": 0, "cost": 0.0, "api_calls": 0,
+                   "rate_limited": 0}
 
     for i, batch in enumerate(batches):
         # Build prompt
@@ -408,7 +445,7 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
         # Call API
         results, usage = call_api(
             config["model"], config["system_prompt"], user_prompt,
-            batch_num=i + 1, total_batches=len(batches)
+            batch_num=i + 1, total_batches=len(batches), quiet=quiet
         )
 
         all_results.extend(results)
@@ -416,8 +453,9 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
         total_usage["output_tokens"] += usage["output_tokens"]
         total_usage["cost"] += usage["cost"]
         total_usage["api_calls"] += 1
+        total_usage["rate_limited"] += usage["rate_limited"]
 
-        print(f"    Batch {i+1}/{len(batches)}: {len(results)} results, "
+        say(f"    Batch {i+1}/{len(batches)}: {len(results)} results, "
               f"${usage['cost']:.4f}")
 
         # Small delay between batches to avoid rate limiting
@@ -441,8 +479,9 @@ def run_pass(pass_num: int, session_dir: Path, data: Dict,
 
     # Write output file
     output_file = session_dir / config["output_file"]
-    with open(output_file, "w") as f:
-        json.dump(output, f, indent=2)
+    # Atomic: an interrupted write must not leave a partial file that
+    # --resume would take for a finished pass
+    atomic_json_dump(output_file, output)
     logger.info(f"    Output: {output_file.name} ({output_file.stat().st_size / 1024:.1f} KB)")
 
     return output
@@ -512,8 +551,59 @@ def run_all_passes(session_dir: Path, dry_run: bool = False,
     }
 
 
+def run_single_pass(session_dir: Path, pass_num: int, dry_run: bool = False,
+                    quiet: bool = False) -> Dict:
+    """Run one pass on one session, loading Pass 1 output from disk for Pass 3.
+
+    In-process entry point for batch orchestrators (no interpreter per call);
+    they pass quiet=True so per-batch lines stay out of their progress output.
+
+    Raises:
+        ValueError: Unknown pass number
+        FileNotFoundError: Pass 3 requested before Pass 1 output exists
+
+    Returns:
+        run_pass() output dict (total_usage holds cost and token counts)
+    """
+    if pass_num not in PASS_CONFIGS:
+        raise ValueError(f"Pass {pass_num} not found. Valid: {list(PASS_CONFIGS.keys())}")
+
+    data = load_enriched_session(session_dir)
+
+    # Pass 3 needs Pass 1 results
+    pass1_results = None
+    if pass_num == 3:
+        p1_file = session_dir / PASS_CONFIGS[1]["output_file"]
+        if not p1_file.exists():
+            raise FileNotFoundError("Pass 3 requires Pass 1 results. Run Pass 1 first.")
+        with open(p1_file) as f:
+            pass1_results = json.load(f)
+
+    return run_pass(pass_num, session_dir, data, pass1_results=pass1_results,
+                    dry_run=dry_run, quiet=quiet)
+
+
 # ── CLI ───────────────────────────────────────────────────────────────
 
+# Prefix of the machine-readable summary line printed last by the CLI.
+# Subprocess callers json.loads the text after it instead of scraping
+# "$X.YZ" out of the human-readable log.
+RESULT_PREFIX = "##RESULT##"
+
+
+def emit_result(outputs: List[Dict]):
+    """Print one RESULT_PREFIX line summing cost and tokens over pass outputs."""
+    summary = {"cost": 0.0, "input_tokens": 0, "output_tokens": 0}
+    for output in outputs:
+        usage = output.get("total_usage", {})
+        summary["cost"] += usage.get("cost", output.get("estimated_cost", 0.0))
+        summary["input_tokens"] += usage.get("input_tokens", 0)
+        summary["output_tokens"] += usage.get("output_tokens", 0)
+    sys.stdout.write(RESULT_PREFIX + json.dumps(summary) + "\n")
+    sys.stdout.flush()
+
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Phase 0 LLM Pass Runner — Run behavioral analysis passes"
@@ -536,7 +626,12 @@ def main():
         sys.exit(1)
 
     if args.pass_num == "all":
-        run_all_passes(session_dir, dry_run=args.dry_run)
+        try:
+            combined = run_all_passes(session_dir, dry_run=args.dry_run)
+        except anthropic.APIError as e:
+            logger.error(f"ERROR: {e}")
+            sys.exit(1)
+        outputs = list(combined["passes"].values())
     else:
         try:
             pass_num = int(args.pass_num)
@@ -544,25 +639,13 @@ def main():
             logger.error(f"ERROR: Invalid pass number: {args.pass_num}")
             sys.exit(1)
 
-        if pass_num not in PASS_CONFIGS:
-            logger.error(f"ERROR: Pass {pass_num} not found. Valid: {list(PASS_CONFIGS.keys())}")
+        try:
+            outputs = [run_single_pass(session_dir, pass_num, dry_run=args.dry_run)]
+        except (ValueError, FileNotFoundError, anthropic.APIError) as e:
+            logger.error(f"ERROR: {e}")
             sys.exit(1)
 
-        data = load_enriched_session(session_dir)
-
-        # Pass 3 needs Pass 1 results
-        pass1_results = None
-        if pass_num == 3:
-            p1_file = session_dir / PASS_CONFIGS[1]["output_file"]
-            if p1_file.exists():
-                with open(p1_file) as f:
-                    pass1_results = json.load(f)
-            else:
-                logger.error("ERROR: Pass 3 requires Pass 1 results. Run Pass 1 first.")
-                sys.exit(1)
-
-        run_pass(pass_num, session_dir, data, pass1_results=pass1_results,
-                 dry_run=args.dry_run)
+    emit_result(outputs)
 
 
 if __name__ == "__main__":
@@ -28,6 +28,7 @@ from config import OUTPUT_DIR as DEFAULT_OUTPUT_DIR
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from prompts import PASS_CONFIGS
+from tools.file_lock import atomic_json_dump
 from tools.log_config import get_logger
 
 logger = get_logger("phase0.merge_llm_results")
@@ -192,8 +193,7 @@ def merge_session(session_dir: Path, write_output: bool = True) -> Dict:
     # Write output
     if write_output:
         output_path = session_dir / "enriched_session_v2.json"
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        atomic_json_dump(output_path, data, default=str)
         size_mb = output_path.stat().st_size / (1024 * 1024)
         logger.info(f"\n  Output: {output_path.name} ({size_mb:.1f} MB)")
 
@@ -0,0 +1,59 @@
+"""
+Phase 0 child interpreter — enrich_session.py + prepare_agent_data.py in one process.
+
+enrich_session.py and prepare_agent_data.py take their session from the
+environment at import time (prepare_agent_data does all of its work at
+module level), so they cannot be called as functions. Callers run both
+through runpy in ONE child interpreter per session instead of one each:
+interpreter startup and the shared imports (config, tools, json) are paid
+once. The child's exit status says which step failed (PHASE0_STEPS).
+
+Usage:
+    from phase_0_prep.phase0_child import PHASE0_STEPS, phase0_child_source
+
+    result = subprocess.run([sys.executable, "-c", phase0_child_source()], env=env)
+    if result.returncode != 0:
+        step = PHASE0_STEPS.get(result.returncode, "phase 0")
+"""
+from pathlib import Path
+
+PHASE0_DIR = Path(__file__).resolve().parent
+REPO = PHASE0_DIR.parent
+
+# Exit status of the child -> the step that failed
+PHASE0_STEPS = {10: "enrich_session.py", 11: "prepare_agent_data.py"}
+
+_PHASE0_CHILD = """\
+import runpy, sys, traceback
+sys.path[:0] = [{repo!r}, {phase0!r}]
+banner = {banner!r}
+for status, script in ((10, {enrich!r}), (11, {prepare!r})):
+    if status == 11 and banner:
+        print()
+        print(banner, flush=True)
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+            sys.exit(status)
+    except Exception:
+        traceback.print_exc()
+        sys.exit(status)
+"""
+
+
+def phase0_child_source(banner=None):
+    """Source for `python -c` that runs both Phase 0 steps for the session in the environment.
+
+    banner, if given, is printed between the two steps (for callers that
+    show the child's output live).
+    """
+    return _PHASE0_CHILD.format(
+        repo=str(REPO),
+        phase0=str(PHASE0_DIR),
+        banner=banner,
+        enrich=str(PHASE0_DIR / "enrich_session.py"),
+        prepare=str(PHASE0_DIR / "prepare_agent_data.py"),
+    )
@@ -6,7 +6,8 @@ Executes the 4 LLM passes (content-ref, behaviors, intent, importance)
 across all sessions with enriched_session.json. Manages concurrency,
 checkpointing, cost tracking, and pass ordering.
 
-Pass order: 1→2→3→4 (Pass 3 depends on Pass 1 results)
+Pass order: per session, Pass 3 runs after Pass 1; Passes 1, 2 and 4 start at once
+(Haiku and Opus passes use separate pools).
 Concurrency: Passes 1,4 (Haiku) up to 50-60 concurrent. Passes 2,3 (Opus) up to 30.
 
 Usage:
@@ -30,17 +31,24 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import time
+import hashlib
+import random
+import queue
 import argparse
-import subprocess
+import threading
 from pathlib import Path
+from collections import Counter, deque
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import List, Dict, Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from tools.file_lock import atomic_json_write, sweep_tmp_files
 from tools.log_config import get_logger
 
 logger = get_logger("phase1.batch_p1_llm")
@@ -56,18 +64,38 @@ except ImportError:
     OUTPUT_DIR = _STORE / "sessions"
     CHECKPOINT_DIR = _STORE / "indexes"
 CHECKPOINT_FILE = CHECKPOINT_DIR / "llm_pass_checkpoint.json"
-COST_LOG_FILE = CHECKPOINT_DIR / "llm_pass_cost_log.json"
+COST_LOG_FILE = CHECKPOINT_DIR / "llm_pass_cost_log.jsonl"
+LEGACY_COST_LOG_FILE = CHECKPOINT_DIR / "llm_pass_cost_log.json"
 
-# Pass runner script
-PASS_RUNNER = REPO / "phase_0_prep" / "llm_pass_runner.py"
-MERGE_SCRIPT = REPO / "phase_0_prep" / "merge_llm_results.py"
 
 # Concurrency limits (from Feb 8 testing: 50-60 Haiku stable, 30 Opus stable)
 HAIKU_CONCURRENCY = 50
 OPUS_CONCURRENCY = 30
 
-# Cooldown between batches (seconds)
-BATCH_COOLDOWN = 5
+# Dispatch rate limits (sessions started per second per model); bursts are
+# capped at the concurrency limits above
+HAIKU_RATE = 50
+OPUS_RATE = 10
+
+# Seconds of dispatch budget drained for each 429 a pass ran into
+RATE_LIMIT_PENALTY = 5
+
+# Session-level retries for transient failures that escape the per-call
+# retries in llm_pass_runner: backoff doubles from RETRY_BASE up to RETRY_MAX_WAIT
+SESSION_RETRIES = 3
+RETRY_BASE = 10
+RETRY_MAX_WAIT = 120
+RETRY_JITTER = 5
+_RETRYABLE = re.compile(r"429|rate.?limit|quota|overloaded|\b5\d\d\b|connection|timed? ?out", re.I)
+_RATE_LIMITED = re.compile(r"429|rate.?limit|quota", re.I)
+
+# Report progress every N completed sessions
+CHECKPOINT_INTERVAL = 25
+
+# The checkpoint writer thread saves after this many results or seconds,
+# whichever comes first
+CHECKPOINT_FLUSH_EVERY = 50
+CHECKPOINT_FLUSH_SECONDS = 10
 
 # Validation sessions (including the primary test session 0012ebed)
 VALIDATION_SESSIONS = [
@@ -78,6 +106,9 @@ VALIDATION_SESSIONS = [
     "session_c7e7d342",
 ]
 
+# Passes each pass needs finished first, per session (Pass 3 reads Pass 1)
+PASS_DEPENDENCIES = {1: (), 2: (), 3: (1,), 4: ()}
+
 # Pass output filenames (must match prompts.py PASS_CONFIGS)
 PASS_OUTPUT_FILES = {
     1: "llm_pass1_content_ref.json",
@@ -87,147 +118,448 @@ PASS_OUTPUT_FILES = {
 }
 
 
+# ── Rate limiting ─────────────────────────────────────────────────────
+
+class TokenBucket:
+    """Thread-safe token bucket pacing session dispatch for one model.
+
+    Tokens refill continuously at `rate` per second up to `burst`. A caller
+    that finds the bucket empty takes its token on credit and sleeps off the
+    debt outside the lock, so waiters queue up in arrival order.
+    """
+    __slots__ = ("_rate", "_burst", "_tokens", "_last", "_lock")
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Drain `seconds` worth of tokens, slowing every thread after a 429."""
+        with self._lock:
+            self._tokens -= seconds * self._rate
+
+
+HAIKU_BUCKET = TokenBucket(HAIKU_RATE, HAIKU_CONCURRENCY)
+OPUS_BUCKET = TokenBucket(OPUS_RATE, OPUS_CONCURRENCY)
+
+
 # ── Session discovery ─────────────────────────────────────────────────
 
+def _has_enriched(entry: os.DirEntry) -> bool:
+    """True if a scandir entry is a session directory with enriched_session.json."""
+    return entry.is_dir() and os.path.exists(os.path.join(entry.path, "enriched_session.json"))
+
+
+@lru_cache(maxsize=1)
+def _scan_sessions() -> tuple:
+    """Scan OUTPUT_DIR once per process; the stat probes run on a thread pool."""
+    try:
+        with os.scandir(OUTPUT_DIR) as it:
+            entries = sorted((e for e in it if e.name.startswith("session_")),
+                             key=lambda e: e.name)
+    except FileNotFoundError:
+        return ()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        keep = list(executor.map(_has_enriched, entries))
+    return tuple(Path(e.path) for e, k in zip(entries, keep) if k)
+
+
 def get_all_sessions() -> List[Path]:
-    """Get all session directories with enriched_session.json."""
-    sessions = []
-    if not OUTPUT_DIR.exists():
-        return sessions
-    for d in sorted(OUTPUT_DIR.iterdir()):
-        if not d.is_dir() or not d.name.startswith("session_"):
-            continue
-        if not (d / "enriched_session.json").exists():
-            continue
-        sessions.append(d)
-    return sessions
+    """Get all session directories with enriched_session.json.
+
+    The directory scan is cached for the life of the process; call
+    _scan_sessions.cache_clear() if sessions are added mid-run.
+    """
+    return list(_scan_sessions())
+
+
+def session_files(session_dir: Path) -> set:
+    """Names in a session directory, from one scandir instead of a stat per file."""
+    try:
+        with os.scandir(session_dir) as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
 
 
-def get_sessions_needing_pass(sessions: List[Path], pass_num: int) -> List[Path]:
-    """Filter to sessions that haven't completed a specific pass."""
+def get_sessions_needing_pass(sessions: List[Path], pass_num: int,
+                              checkpoint: Optional[Dict] = None) -> List[Path]:
+    """Filter to sessions that haven't completed a specific pass.
+
+    Sessions recorded as complete in the checkpoint are skipped without
+    touching the disk; only the rest are checked for the pass output file.
+    """
+    done = completed_in_checkpoint(checkpoint, pass_num) if checkpoint else {}
     output_file = PASS_OUTPUT_FILES[pass_num]
-    return [s for s in sessions if not (s / output_file).exists()]
+    return [s for s in sessions
+            if s.name not in done and not (s / output_file).exists()]
 
 
 # ── Checkpoint management ─────────────────────────────────────────────
 
 def load_checkpoint() -> Dict:
-    """Load the checkpoint file."""
+    """Load the checkpoint file.
+
+    completed_sessions maps "passN" -> {session name: result payload}.
+    Checkpoints written before payloads were recorded hold a plain list of
+    session names; those are upgraded to empty payloads on load.
+    """
     if CHECKPOINT_FILE.exists():
         with open(CHECKPOINT_FILE) as f:
-            return json.load(f)
+            checkpoint = json.load(f)
+        completed = checkpoint.setdefault("completed_sessions", {})
+        for key, entries in completed.items():
+            if isinstance(entries, list):
+                completed[key] = {name: {} for name in entries}
+        return checkpoint
     return {"passes": {}, "completed_sessions": {}, "total_cost": 0.0}
 
 
+def completed_in_checkpoint(checkpoint: Dict, pass_num: int) -> Dict[str, Dict]:
+    """Session name -> result payload for every session that finished a pass."""
+    return checkpoint.get("completed_sessions", {}).get(f"pass{pass_num}", {})
+
+
 def save_checkpoint(checkpoint: Dict):
-    """Save the checkpoint file."""
-    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CHECKPOINT_FILE, "w") as f:
-        json.dump(checkpoint, f, indent=2)
+    """Save the checkpoint file atomically (temp file + rename).
+
+    An interrupted run leaves the previous checkpoint intact rather than a
+    truncated file that would break --resume.
+    """
+    atomic_json_write(CHECKPOINT_FILE, checkpoint)
+
+
+_COST_LOG_LOCK = threading.Lock()
+
+
+def migrate_cost_log():
+    """Convert the legacy JSON-array cost log to JSONL, once.
+
+    Entries are prepended to any JSONL lines already written, and the old
+    file is removed so the conversion never runs twice.
+    """
+    if not LEGACY_COST_LOG_FILE.exists():
+        return
+    with _COST_LOG_LOCK:
+        with open(LEGACY_COST_LOG_FILE) as f:
+            legacy = json.load(f)
+        existing = ""
+        if COST_LOG_FILE.exists():
+            existing = COST_LOG_FILE.read_text()
+        tmp = COST_LOG_FILE.with_suffix(".jsonl.tmp")
+        with open(tmp, "w") as f:
+            for entry in legacy:
+                f.write(json.dumps(entry) + "\n")
+            f.write(existing)
+        os.replace(tmp, COST_LOG_FILE)
+        LEGACY_COST_LOG_FILE.unlink()
+    logger.info(f"Migrated {len(legacy)} cost log entries to {COST_LOG_FILE.name}")
 
 
 def update_cost_log(pass_num: int, session_name: str, cost: float, model: str):
-    """Append to the cost log."""
-    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
-    log = []
-    if COST_LOG_FILE.exists():
-        with open(COST_LOG_FILE) as f:
-            log = json.load(f)
-    log.append({
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    """Append one line to the JSONL cost log.
+
+    Entries carry an integer ts_ns (time.time_ns()); it is only formatted
+    when the log is displayed (see entry_time).
+    """
+    line = json.dumps({
+        "ts_ns": time.time_ns(),
         "pass": pass_num,
         "session": session_name,
         "cost": cost,
         "model": model,
-    })
-    with open(COST_LOG_FILE, "w") as f:
-        json.dump(log, f, indent=2)
+    }) + "\n"
+    with _COST_LOG_LOCK:
+        CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+        with open(COST_LOG_FILE, "a") as f:
+            f.write(line)
+
+
+def read_cost_log() -> List[Dict]:
+    """Read every entry from the JSONL cost log, skipping torn lines.
+
+    A legacy JSON-array log that has not been migrated yet (only runs that
+    append migrate it) is read first, so its entries keep their place.
+    """
+    entries = []
+    if LEGACY_COST_LOG_FILE.exists():
+        with open(LEGACY_COST_LOG_FILE) as f:
+            entries.extend(json.load(f))
+    if not COST_LOG_FILE.exists():
+        return entries
+    with open(COST_LOG_FILE) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
+def entry_time(entry: Dict) -> str:
+    """ISO-8601 UTC time of a cost log entry (ts_ns, or the older timestamp string)."""
+    if "ts_ns" in entry:
+        return datetime.fromtimestamp(entry["ts_ns"] / 1e9, timezone.utc).isoformat()
+    return entry.get("timestamp", "")
+
+
+def sweep_partial_outputs():
+    """Remove temp files left in session directories by an interrupted run."""
+    removed = sum(sweep_tmp_files(s) for s in get_all_sessions())
+    if removed:
+        logger.info(f"Removed {removed} partial output file(s) from an interrupted run")
 
 
 # ── Single session processing ─────────────────────────────────────────
 
+def _llm_pass_runner():
+    """phase_0_prep.llm_pass_runner, imported on first use.
+
+    The runner builds an Anthropic client at import, which --status and
+    --merge-all have no need for.
+    """
+    from phase_0_prep import llm_pass_runner
+    return llm_pass_runner
+
+
 def run_pass_on_session(session_dir: Path, pass_num: int,
-                        dry_run: bool = False, timeout: int = 300) -> Dict:
-    """Run a single LLM pass on a single session via subprocess.
+                        dry_run: bool = False) -> Dict:
+    """Run a single LLM pass on a single session, in-process.
+
+    Calls llm_pass_runner.run_single_pass directly from the worker thread
+    (the work is API I/O, so threads are not GIL-bound) and reads cost and
+    token counts from its return value. The pass runs quiet: its per-batch
+    lines go to logger.debug, leaving stdout to the orchestrator's progress.
+
+    Transient failures (rate limits, 5xx, connection errors) are retried up
+    to SESSION_RETRIES times with capped exponential backoff; anything else
+    fails fast.
 
     Returns dict with status, cost, and timing info.
     """
     session_name = session_dir.name
+    bucket = OPUS_BUCKET if pass_num in (2, 3) else HAIKU_BUCKET
     start = time.time()
 
-    cmd = [
-        sys.executable, str(PASS_RUNNER),
-        "--pass", str(pass_num),
-        "--session", session_name,
-    ]
-    if dry_run:
-        cmd.append("--dry-run")
-
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=timeout
-        )
-        elapsed = time.time() - start
-
-        # Parse cost from output (look for $ amount)
-        cost = 0.0
-        for line in result.stdout.split('\n'):
-            if '$' in line and ('Total' in line or 'cost' in line.lower()):
-                import re
-                match = re.search(r'\$([0-9]+\.?[0-9]*)', line)
-                if match:
-                    cost = float(match.group(1))
-
-        success = result.returncode == 0
-        return {
-            "session": session_name,
-            "pass": pass_num,
-            "success": success,
-            "cost": cost,
-            "elapsed": round(elapsed, 1),
-            "error": result.stderr[:200] if not success else None,
-            "dry_run": dry_run,
-        }
-
-    except subprocess.TimeoutExpired:
+    error = None
+    for attempt in range(SESSION_RETRIES):
+        if not dry_run:
+            bucket.acquire()
+        # Broad except on purpose: the pass runs in this process, and one
+        # session's failure must be recorded, not raised out of the whole batch.
+        try:
+            output = _llm_pass_runner().run_single_pass(
+                session_dir, pass_num, dry_run=dry_run, quiet=True)
+            error = None
+            break
+        except Exception as e:
+            error = e
+            if attempt == SESSION_RETRIES - 1 or not _RETRYABLE.search(str(e)):
+                break
+            wait = min(RETRY_MAX_WAIT, RETRY_BASE * 2 ** attempt) + random.uniform(0, RETRY_JITTER)
+            if _RATE_LIMITED.search(str(e)):
+                bucket.penalize(wait)
+            logger.warning(f"  {session_name} pass {pass_num}: {str(e)[:100]} — "
+                           f"retrying in {wait:.0f}s (attempt {attempt + 1}/{SESSION_RETRIES})")
+            time.sleep(wait)
+
+    if error is not None:
         return {
             "session": session_name,
             "pass": pass_num,
             "success": False,
             "cost": 0.0,
-            "elapsed": timeout,
-            "error": f"timeout after {timeout}s",
-            "dry_run": dry_run,
-        }
-    except (subprocess.SubprocessError, OSError, ValueError) as e:
-        return {
-            "session": session_name,
-            "pass": pass_num,
-            "success": False,
-            "cost": 0.0,
-            "elapsed": time.time() - start,
-            "error": str(e)[:200],
+            "elapsed": round(time.time() - start, 1),
+            "error": str(error)[:200],
             "dry_run": dry_run,
         }
 
+    usage = output.get("total_usage", {})
+    if usage.get("rate_limited"):
+        bucket.penalize(RATE_LIMIT_PENALTY * usage["rate_limited"])
+    return {
+        "session": session_name,
+        "pass": pass_num,
+        "success": True,
+        "cost": usage.get("cost", output.get("estimated_cost", 0.0)),
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "elapsed": round(time.time() - start, 1),
+        "error": None,
+        "dry_run": dry_run,
+    }
+
+
+# Sidecar recording the digest of the inputs enriched_session_v2.json was
+# merged from; a matching digest means re-merging would be a no-op
+MERGE_DIGEST_FILE = "enriched_session_v2.merge_inputs.sha256"
+MERGE_INPUT_FILES = ("enriched_session.json",) + tuple(PASS_OUTPUT_FILES[p] for p in (1, 2, 3, 4))
+
+
+def merge_inputs_digest(session_dir: Path) -> str:
+    """SHA-256 over the merge inputs (enriched_session.json and every pass output)."""
+    digest = hashlib.sha256()
+    for name in MERGE_INPUT_FILES:
+        digest.update(name.encode() + b"\0")
+        try:
+            with open(session_dir / name, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            digest.update(b"\0missing")
+    return digest.hexdigest()
+
+
+def merge_session(session_dir: Path, force: bool = False) -> Dict:
+    """Merge a session's pass outputs into enriched_session_v2.json, in-process.
+
+    Skipped (success, skipped=True) when enriched_session_v2.json exists and
+    its inputs hash the same as at the last merge, unless force is set.
+    """
+    from phase_0_prep.merge_llm_results import merge_session as merge_llm_results
 
-def merge_session(session_dir: Path, timeout: int = 120) -> Dict:
-    """Run the merge script on a session."""
     session_name = session_dir.name
-    cmd = [
-        sys.executable, str(MERGE_SCRIPT),
-        "--session", session_name,
-    ]
+    # Broad except on purpose: this runs inside executor.map, where an
+    # escaping exception would abort every remaining session's merge.
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        return {"session": session_name, "success": result.returncode == 0,
-                "error": result.stderr[:200] if result.returncode != 0 else None}
-    except (subprocess.SubprocessError, OSError) as e:
-        return {"session": session_name, "success": False, "error": str(e)[:200]}
+        digest = merge_inputs_digest(session_dir)
+        digest_file = session_dir / MERGE_DIGEST_FILE
+        if (not force and (session_dir / "enriched_session_v2.json").exists()
+                and digest_file.exists() and digest_file.read_text().strip() == digest):
+            return {"session": session_name, "success": True, "skipped": True, "error": None}
+        merge_llm_results(session_dir)
+        digest_file.write_text(digest + "\n")
+        return {"session": session_name, "success": True, "skipped": False, "error": None}
+    except Exception as e:
+        return {"session": session_name, "success": False, "skipped": False,
+                "error": f"{type(e).__name__}: {e}"[:200]}
+
+
+def merge_sessions(sessions: List[Path]):
+    """Merge many sessions across a process pool, yielding results in order.
+
+    Merging is JSON parsing and rebuilding (CPU-bound), so processes rather
+    than threads; each worker calls merge_llm_results in-process.
+    """
+    if len(sessions) <= 1:
+        yield from map(merge_session, sessions)
+        return
+    workers = min(len(sessions), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(merge_session, sessions, chunksize=4)
 
 
 # ── Batch processing ──────────────────────────────────────────────────
 
+def pass_model(pass_num: int) -> str:
+    """Model family a pass runs on: Passes 2 and 3 are Opus, 1 and 4 Haiku."""
+    return "Opus" if pass_num in (2, 3) else "Haiku"
+
+
+def record_result(checkpoint: Dict, result: Dict):
+    """Fold one successful pass result into the checkpoint and cost log.
+
+    Each completed session keeps a compact payload (cost, tokens, time) so
+    resume and status can answer from the checkpoint alone. Dry-run results
+    are not recorded: they would mark sessions complete that never ran.
+    """
+    if not result["success"] or result["dry_run"]:
+        return
+    pass_num = result["pass"]
+    key = f"pass{pass_num}"
+    checkpoint.setdefault("completed_sessions", {}).setdefault(key, {})[result["session"]] = {
+        "cost": result["cost"],
+        "elapsed": result["elapsed"],
+        "input_tokens": result.get("input_tokens", 0),
+        "output_tokens": result.get("output_tokens", 0),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+    }
+    checkpoint["total_cost"] = checkpoint.get("total_cost", 0) + result["cost"]
+
+    update_cost_log(pass_num, result["session"], result["cost"], pass_model(pass_num))
+
+
+class CheckpointWriter:
+    """Single thread that owns the checkpoint while passes run.
+
+    The dispatch loop only enqueues results; this thread folds them into
+    the checkpoint (record_result) and saves it every CHECKPOINT_FLUSH_EVERY
+    results or CHECKPOINT_FLUSH_SECONDS, so serializing a growing checkpoint
+    never stalls dispatch. Leaving the with-block flushes what is left.
+    """
+
+    def __init__(self, checkpoint: Dict):
+        self.checkpoint = checkpoint
+        self.failed = 0  # results record_result raised on
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer",
+                                        daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._queue.put(None)
+        self._thread.join()
+        if self.failed:
+            logger.error(f"  {self.failed} result(s) could not be recorded in the checkpoint")
+
+    def put(self, result: Dict):
+        self._queue.put(result)
+
+    # Both handlers below are broad on purpose: an exception escaping _run
+    # kills the thread, and every later put() would go unrecorded and unsaved.
+    def _flush(self):
+        try:
+            save_checkpoint(self.checkpoint)
+        except Exception as e:
+            logger.error(f"  Checkpoint save failed: {e}")
+
+    def _run(self):
+        unsaved = 0
+        last_save = time.monotonic()
+        while True:
+            try:
+                result = self._queue.get(timeout=CHECKPOINT_FLUSH_SECONDS)
+            except queue.Empty:
+                result = False
+            if result is None:
+                if unsaved:
+                    self._flush()
+                return
+            if result:
+                try:
+                    record_result(self.checkpoint, result)
+                except Exception as e:
+                    self.failed += 1
+                    logger.error(f"  Recording {result.get('session')} pass "
+                                 f"{result.get('pass')} failed: {e}")
+                unsaved += 1
+            if unsaved and (unsaved >= CHECKPOINT_FLUSH_EVERY
+                            or time.monotonic() - last_save >= CHECKPOINT_FLUSH_SECONDS):
+                self._flush()
+                unsaved = 0
+                last_save = time.monotonic()
+
+
 def run_pass_batch(sessions: List[Path], pass_num: int,
                    dry_run: bool = False, resume: bool = False) -> Dict:
     """Run a single pass across multiple sessions with concurrency control.
@@ -235,13 +567,14 @@ def run_pass_batch(sessions: List[Path], pass_num: int,
     Returns aggregate statistics.
     """
     # Determine concurrency
-    is_opus = pass_num in [2, 3]
-    max_workers = OPUS_CONCURRENCY if is_opus else HAIKU_CONCURRENCY
-    model_name = "Opus" if is_opus else "Haiku"
+    model_name = pass_model(pass_num)
+    max_workers = OPUS_CONCURRENCY if model_name == "Opus" else HAIKU_CONCURRENCY
+
+    checkpoint = load_checkpoint()
 
     # Filter to sessions needing this pass (if resuming)
     if resume:
-        sessions = get_sessions_needing_pass(sessions, pass_num)
+        sessions = get_sessions_needing_pass(sessions, pass_num, checkpoint)
 
     if not sessions:
         logger.info(f"  Pass {pass_num}: No sessions need processing")
@@ -252,54 +585,45 @@ def run_pass_batch(sessions: List[Path], pass_num: int,
     logger.info(f"Concurrency: {max_workers} | {'DRY RUN' if dry_run else 'LIVE'}")
     logger.info(f"{'=' * 60}")
 
-    checkpoint = load_checkpoint()
     results = []
     total_cost = 0.0
     success_count = 0
     fail_count = 0
 
-    # Process in batches to manage memory and provide progress
-    batch_size = max_workers
-    for batch_start in range(0, len(sessions), batch_size):
-        batch = sessions[batch_start:batch_start + batch_size]
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(run_pass_on_session, s, pass_num, dry_run): s
-                for s in batch
-            }
-
-            for future in as_completed(futures):
+    # Continuous submission: a new session starts the moment any in-flight
+    # one finishes, so a slow session never idles the other workers the way
+    # a wait-for-the-whole-batch loop does. The queue is fully resolved up
+    # front, so refilling a slot never touches the disk.
+    pending = deque(sessions)
+    in_flight = set()
+    with CheckpointWriter(checkpoint) as writer, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def top_up():
+            while pending and len(in_flight) < max_workers:
+                in_flight.add(executor.submit(run_pass_on_session, pending.popleft(),
+                                              pass_num, dry_run))
+
+        top_up()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            in_flight.difference_update(done)
+            top_up()
+
+            for future in done:
                 result = future.result()
                 results.append(result)
 
+                writer.put(result)
                 if result["success"]:
                     success_count += 1
                     total_cost += result["cost"]
-
-                    # Update checkpoint
-                    key = f"pass{pass_num}"
-                    if key not in checkpoint.get("completed_sessions", {}):
-                        checkpoint.setdefault("completed_sessions", {})[key] = []
-                    checkpoint["completed_sessions"][key].append(result["session"])
-                    checkpoint["total_cost"] = checkpoint.get("total_cost", 0) + result["cost"]
-
-                    if not dry_run:
-                        update_cost_log(pass_num, result["session"], result["cost"], model_name)
                 else:
                     fail_count += 1
 
-        # Progress report
-        processed = batch_start + len(batch)
-        print(f"  [{processed}/{len(sessions)}] success={success_count} "
-              f"failed={fail_count} cost=${total_cost:.4f}")
-
-        # Save checkpoint between batches
-        save_checkpoint(checkpoint)
-
-        # Cooldown between batches
-        if batch_start + batch_size < len(sessions):
-            time.sleep(BATCH_COOLDOWN)
+                # Progress report every CHECKPOINT_INTERVAL completions
+                if len(results) % CHECKPOINT_INTERVAL == 0 or len(results) == len(sessions):
+                    print(f"  [{len(results)}/{len(sessions)}] success={success_count} "
+                          f"failed={fail_count} cost=${total_cost:.4f}")
 
     return {
         "pass": pass_num,
@@ -311,6 +635,94 @@ def run_pass_batch(sessions: List[Path], pass_num: int,
     }
 
 
+def run_passes_concurrently(sessions: List[Path], passes: List[int] = (1, 2, 3, 4),
+                            dry_run: bool = False, resume: bool = False) -> Dict[int, Dict]:
+    """Run several passes across sessions as a per-session dependency graph.
+
+    Haiku passes (1, 4) and Opus passes (2, 3) get separate pools, and a
+    (session, pass) task is submitted as soon as its PASS_DEPENDENCIES have
+    succeeded for that session: Passes 1, 2 and 4 start at once, and Pass 3
+    follows each session's Pass 1. The fast Haiku passes never wait behind
+    a whole Opus pass, so wall time approaches the longest per-session chain
+    rather than the sum of all passes. With resume, passes whose output file
+    exists count as already complete.
+
+    Returns per-pass aggregate statistics keyed by pass number.
+    """
+    stats = {
+        p: {"pass": p, "processed": 0, "success": 0, "failed": 0, "cost": 0.0,
+            "model": pass_model(p)}
+        for p in passes
+    }
+    checkpoint = load_checkpoint()
+    completed = {s: set() for s in sessions}
+    if resume:
+        done = {p: completed_in_checkpoint(checkpoint, p) for p in passes}
+        for s in sessions:
+            completed[s] = {p for p in passes if s.name in done[p]}
+            if len(completed[s]) < len(passes):
+                names = session_files(s)
+                completed[s].update(p for p in passes if PASS_OUTPUT_FILES[p] in names)
+
+    logger.info(f"\n{'=' * 60}")
+    logger.info(f"Passes {list(passes)} — {len(sessions)} sessions")
+    logger.info(f"Concurrency: Haiku {HAIKU_CONCURRENCY}, Opus {OPUS_CONCURRENCY} | "
+                f"{'DRY RUN' if dry_run else 'LIVE'}")
+    logger.info(f"{'=' * 60}")
+
+    finished = 0
+    scheduled = set()
+    with CheckpointWriter(checkpoint) as writer, \
+            ThreadPoolExecutor(max_workers=HAIKU_CONCURRENCY) as haiku_pool, \
+            ThreadPoolExecutor(max_workers=OPUS_CONCURRENCY) as opus_pool:
+
+        def submit_ready(session: Path) -> Dict:
+            """Submit every pass of session whose dependencies are satisfied."""
+            submitted = {}
+            for p in passes:
+                if p in completed[session] or (session, p) in scheduled:
+                    continue
+                if all(dep in completed[session] for dep in PASS_DEPENDENCIES[p]):
+                    pool = opus_pool if pass_model(p) == "Opus" else haiku_pool
+                    future = pool.submit(run_pass_on_session, session, p, dry_run)
+                    submitted[future] = (session, p)
+                    scheduled.add((session, p))
+            return submitted
+
+        in_flight = {}
+        for s in sessions:
+            in_flight.update(submit_ready(s))
+        total = len(in_flight)
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                session, p = in_flight.pop(future)
+                result = future.result()
+                writer.put(result)
+
+                pass_stats = stats[p]
+                pass_stats["processed"] += 1
+                if result["success"]:
+                    pass_stats["success"] += 1
+                    pass_stats["cost"] += result["cost"]
+                    completed[session].add(p)
+                    follow_ups = submit_ready(session)
+                    total += len(follow_ups)
+                    in_flight.update(follow_ups)
+                else:
+                    pass_stats["failed"] += 1
+
+                finished += 1
+                if finished % CHECKPOINT_INTERVAL == 0 or not in_flight:
+                    cost = sum(st["cost"] for st in stats.values())
+                    print(f"  [{finished}/{total}] " + " ".join(
+                        f"P{st['pass']}={st['success']}/{st['processed']}"
+                        for st in stats.values()) + f" cost=${cost:.4f}")
+
+    return stats
+
+
 # ── High-level commands ───────────────────────────────────────────────
 
 def show_status():
@@ -322,23 +734,41 @@ def show_status():
     logger.info(f"Total sessions with enriched_session.json: {len(sessions)}")
     logger.info("")
 
+    # One directory read per session answers every pass and merge check
+    targets = {fname: p for p, fname in PASS_OUTPUT_FILES.items()}
+    targets["enriched_session_v2.json"] = "merged"
+    counts = Counter()
+    for s in sessions:
+        names = session_files(s)
+        counts.update(tag for fname, tag in targets.items() if fname in names)
+
+    config_name = {1: "Content-Ref (Haiku)", 2: "Behaviors (Opus)",
+                   3: "Intent (Opus)", 4: "Importance (Haiku)"}
     for pass_num in [1, 2, 3, 4]:
-        output_file = PASS_OUTPUT_FILES[pass_num]
-        complete = sum(1 for s in sessions if (s / output_file).exists())
+        complete = counts[pass_num]
         remaining = len(sessions) - complete
-        config_name = {1: "Content-Ref (Haiku)", 2: "Behaviors (Opus)",
-                       3: "Intent (Opus)", 4: "Importance (Haiku)"}
         print(f"  Pass {pass_num} [{config_name[pass_num]}]: "
               f"{complete}/{len(sessions)} ({remaining} remaining)")
 
     # Check for merged files
-    merged = sum(1 for s in sessions if (s / "enriched_session_v2.json").exists())
+    merged = counts["merged"]
     logger.info(f"\n  Merged (v2): {merged}/{len(sessions)}")
 
+    # Per-task payloads recorded in the checkpoint
+    checkpoint = load_checkpoint()
+    for pass_num in [1, 2, 3, 4]:
+        payloads = completed_in_checkpoint(checkpoint, pass_num).values()
+        if not payloads:
+            continue
+        tokens_in = sum(e.get("input_tokens", 0) for e in payloads)
+        tokens_out = sum(e.get("output_tokens", 0) for e in payloads)
+        elapsed = sum(e.get("elapsed", 0) for e in payloads)
+        logger.info(f"    Pass {pass_num} checkpointed: {len(payloads)} sessions, "
+                    f"{tokens_in:,} in / {tokens_out:,} out tokens, {elapsed:.0f}s")
+
     # Cost log
-    if COST_LOG_FILE.exists():
-        with open(COST_LOG_FILE) as f:
-            log = json.load(f)
+    log = read_cost_log()
+    if log:
         total = sum(e["cost"] for e in log)
         logger.info(f"\n  Total cost logged: ${total:.4f}")
         by_pass = {}
@@ -347,6 +777,7 @@ def show_status():
             by_pass[p] = by_pass.get(p, 0) + e["cost"]
         for p in sorted(by_pass):
             logger.info(f"    Pass {p}: ${by_pass[p]:.4f}")
+        logger.info(f"  Last logged: {entry_time(log[-1])}")
     logger.info("")
 
 
@@ -376,17 +807,17 @@ def run_validation(dry_run: bool = False):
     logger.info("")
 
     total_cost = 0.0
-    for pass_num in [1, 2, 3, 4]:
-        result = run_pass_batch(val_sessions, pass_num, dry_run=dry_run)
+    for result in run_passes_concurrently(val_sessions, dry_run=dry_run).values():
         total_cost += result["cost"]
 
     # Merge after all passes
     if not dry_run:
         logger.info(f"\nMerging results...")
-        for s in val_sessions:
-            merge_result = merge_session(s)
+        for merge_result in merge_sessions(val_sessions):
             status = "OK" if merge_result["success"] else f"FAIL: {merge_result['error']}"
-            logger.info(f"  {s.name}: {status}")
+            if merge_result["skipped"]:
+                status = "OK (unchanged)"
+            logger.info(f"  {merge_result['session']}: {status}")
 
     logger.info(f"\n{'=' * 60}")
     logger.info(f"VALIDATION {'DRY RUN ' if dry_run else ''}COMPLETE — Cost: ${total_cost:.4f}")
@@ -404,9 +835,9 @@ def run_all_passes(dry_run: bool = False, resume: bool = False):
     total_cost = 0.0
     start_time = time.time()
 
-    # Pass order: 1→2→3→4
-    for pass_num in [1, 2, 3, 4]:
-        result = run_pass_batch(sessions, pass_num, dry_run=dry_run, resume=resume)
+    # Passes run as a per-session graph (Pass 3 after Pass 1, the rest at once)
+    for pass_num, result in run_passes_concurrently(sessions, dry_run=dry_run,
+                                                    resume=resume).items():
         total_cost += result["cost"]
         print(f"\n  Pass {pass_num} complete: {result['success']}/{result['processed']} "
               f"success, ${result['cost']:.4f}")
@@ -415,16 +846,18 @@ def run_all_passes(dry_run: bool = False, resume: bool = False):
     if not dry_run:
         logger.info(f"\nMerging all sessions...")
         merge_success = 0
+        merge_skipped = 0
         merge_fail = 0
-        for i, s in enumerate(sessions):
-            result = merge_session(s)
+        for i, result in enumerate(merge_sessions(sessions)):
             if result["success"]:
                 merge_success += 1
+                merge_skipped += result["skipped"]
             else:
                 merge_fail += 1
             if (i + 1) % 50 == 0:
                 logger.info(f"  Merged {i+1}/{len(sessions)}...")
-        logger.error(f"  Merge complete: {merge_success} success, {merge_fail} failed")
+        logger.error(f"  Merge complete: {merge_success} success "
+                     f"({merge_skipped} unchanged), {merge_fail} failed")
 
     elapsed = time.time() - start_time
     logger.info(f"\n{'=' * 60}")
@@ -466,6 +899,13 @@ def main():
 
     args = parser.parse_args()
 
+    if not args.status:
+        sweep_partial_outputs()
+    # Only commands that append to the cost log convert it; --status and
+    # --merge-all leave INDEXES_DIR untouched
+    if args.validate or args.pass_num or args.all:
+        migrate_cost_log()
+
     if args.status:
         show_status()
     elif args.validate:
@@ -482,8 +922,7 @@ def main():
     elif args.merge_all:
         sessions = get_all_sessions()
         logger.info(f"Merging {len(sessions)} sessions...")
-        for i, s in enumerate(sessions):
-            result = merge_session(s)
+        for i, result in enumerate(merge_sessions(sessions)):
             if (i + 1) % 50 == 0:
                 logger.info(f"  {i+1}/{len(sessions)}...")
         logger.info("Merge complete.")
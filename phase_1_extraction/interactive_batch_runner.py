@@ -14,6 +14,7 @@ Usage:
 import argparse
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import sys
@@ -21,6 +22,11 @@ import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from tools.log_config import get_logger
 
+try:
+    import ijson
+except ImportError:  # optional: streaming metadata read; full json.load is the fallback
+    ijson = None
+
 logger = get_logger("phase1.interactive_batch_runner")
 
 H3 = Path(__file__).resolve().parent.parent  # hyperdocs_3 root
@@ -28,52 +34,110 @@ OUTPUT = H3 / "output"
 
 P1_FILES = ["thread_extractions.json", "geological_notes.json", "semantic_primitives.json", "explorer_notes.json"]
 P2_FILES = ["idea_graph.json", "synthesis.json", "grounded_markers.json"]
+P1_SET = frozenset(P1_FILES)
+P2_SET = frozenset(P2_FILES)
 
 
-def get_all_sessions():
-    """Get all sessions with Phase 0 complete, sorted by directory name."""
-    sessions = []
-    for d in sorted(OUTPUT.iterdir()):
-        if not d.is_dir() or not d.name.startswith("session_"):
-            continue
-        if not (d / "enriched_session.json").exists():
-            continue
-        if not (d / "safe_tier4.json").exists():
-            continue
+_SCALAR_FIELDS = {
+    "total_messages": "total",
+    "tier_distribution.4_priority": "tier4",
+}
+_CONTAINER_EVENTS = {"start_map", "end_map", "start_array", "end_array", "map_key"}
 
-        summary_f = d / "session_metadata.json"
-        if not summary_f.exists():
-            continue
 
-        with open(summary_f) as fh:
+def _read_stats(path):
+    """Return (total_messages, tier-4 count, files mentioned) from session_metadata.json.
+
+    Stats live under "session_stats" when present, otherwise at the top
+    level. With ijson the file is streamed and only these three values are
+    taken; reading stops once session_stats has yielded all of them.
+    """
+    if ijson is None:
+        with open(path) as fh:
             summary = json.load(fh)
         stats = summary.get("session_stats", summary)
-        total = stats.get("total_messages", 0)
-        if total < 20:
-            continue
-
-        tier4 = stats.get("tier_distribution", {}).get("4_priority", 0)
-        files = len(stats.get("file_mention_counts", {}))
-
-        p1_done = all((d / f).exists() for f in P1_FILES)
-        p2_done = all((d / f).exists() for f in P2_FILES)
+        return (stats.get("total_messages", 0),
+                stats.get("tier_distribution", {}).get("4_priority", 0),
+                len(stats.get("file_mention_counts", {})))
+
+    found = {"": {}, "session_stats": {}}
+    has_stats = False
+    with open(path, "rb") as fh:
+        for prefix, event, value in ijson.parse(fh):
+            if prefix == "" and event == "map_key":
+                has_stats = has_stats or value == "session_stats"
+                continue
+            if prefix.startswith("session_stats."):
+                root, rest = "session_stats", prefix[len("session_stats."):]
+            else:
+                root, rest = "", prefix
+            vals = found[root]
+            if rest == "file_mention_counts":
+                if event == "map_key":
+                    vals["files"] = vals.get("files", 0) + 1
+                elif event == "end_map":
+                    vals["files_done"] = True
+            elif rest in _SCALAR_FIELDS and event not in _CONTAINER_EVENTS:
+                vals[_SCALAR_FIELDS[rest]] = value
+            stats_vals = found["session_stats"]
+            if "total" in stats_vals and "tier4" in stats_vals and "files_done" in stats_vals:
+                break
+
+    vals = found["session_stats"] if has_stats else found[""]
+    return vals.get("total", 0), vals.get("tier4", 0), vals.get("files", 0)
+
+
+def _inspect_session(entry):
+    """Build the queue record for one session directory, or None to skip it."""
+    d = Path(entry.path)
+    # One directory read answers every existence check below
+    with os.scandir(entry.path) as it:
+        names = {e.name for e in it}
+    if "enriched_session.json" not in names:
+        return None
+    if "safe_tier4.json" not in names:
+        return None
+    if "session_metadata.json" not in names:
+        return None
+
+    total, tier4, files = _read_stats(d / "session_metadata.json")
+    if total < 20:
+        return None
+
+    return {
+        "dir": d.name,
+        "short": d.name.replace("session_", ""),
+        "total": total,
+        "tier4": tier4,
+        "files": files,
+        "p1_done": P1_SET <= names,
+        "p2_done": P2_SET <= names,
+        "path": str(d),
+    }
 
-        sessions.append({
-            "dir": d.name,
-            "short": d.name.replace("session_", ""),
-            "total": total,
-            "tier4": tier4,
-            "files": files,
-            "p1_done": p1_done,
-            "p2_done": p2_done,
-            "path": str(d),
-        })
 
-    return sessions
-
-
-def show_status():
-    sessions = get_all_sessions()
+def get_all_sessions():
+    """Get all sessions with Phase 0 complete, sorted by directory name."""
+    try:
+        with os.scandir(OUTPUT) as it:
+            entries = sorted(
+                (e for e in it if e.name.startswith("session_") and e.is_dir()),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
+        return []
+
+    # Per-session work is a scandir plus one JSON read: I/O bound, so threads
+    # overlap the disk waits. map() preserves the sorted order.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_inspect_session, entries)
+        return [r for r in results if r is not None]
+
+
+def show_status(sessions=None):
+    if sessions is None:
+        sessions = get_all_sessions()
     p0 = len(sessions)
     p1 = sum(1 for s in sessions if s["p1_done"])
     p2 = sum(1 for s in sessions if s["p2_done"])
@@ -95,13 +159,18 @@ def show_status():
     logger.info(f"  Total: {need_p1 * 4 + need_p2 * 2}")
 
 
-def show_next():
-    sessions = get_all_sessions()
+def show_next(sessions=None):
+    if sessions is None:
+        sessions = get_all_sessions()
 
-    # Find sessions needing Phase 1
-    need_p1 = [s for s in sessions if not s["p1_done"]]
-    # Find sessions needing Phase 2 (Phase 1 done)
-    need_p2 = [s for s in sessions if s["p1_done"] and not s["p2_done"]]
+    # One pass: sessions needing Phase 1, and sessions needing Phase 2 (Phase 1 done)
+    need_p1 = []
+    need_p2 = []
+    for s in sessions:
+        if not s["p1_done"]:
+            need_p1.append(s)
+        elif not s["p2_done"]:
+            need_p2.append(s)
 
     logger.info("=" * 60)
     logger.info("Next Sessions to Process")
@@ -137,20 +206,29 @@ def show_next():
         logger.info("ALL SESSIONS COMPLETE through Phase 2!")
 
 
-def show_queue():
-    sessions = get_all_sessions()
-    need_p1 = [s for s in sessions if not s["p1_done"]]
+def show_queue(sessions=None):
+    if sessions is None:
+        sessions = get_all_sessions()
 
-    logger.info(f"Full queue — {len(need_p1)} sessions needing Phase 1:")
+    # Group sessions needing Phase 1 by size in a single pass
+    small = []
+    medium = []
+    large = []
+    for s in sessions:
+        if s["p1_done"]:
+            continue
+        if s["total"] >= 500:
+            large.append(s)
+        elif s["total"] >= 100:
+            medium.append(s)
+        else:
+            small.append(s)
+
+    logger.info(f"Full queue — {len(small) + len(medium) + len(large)} sessions needing Phase 1:")
     logger.info("")
     logger.info(f"{'Session':<16} {'Msgs':>6} {'T4':>5} {'Files':>6} {'Size':>8}")
     logger.info("-" * 45)
 
-    # Group by size
-    small = [s for s in need_p1 if s["total"] < 100]
-    medium = [s for s in need_p1 if 100 <= s["total"] < 500]
-    large = [s for s in need_p1 if s["total"] >= 500]
-
     for label, group in [("LARGE (500+)", large), ("MEDIUM (100-500)", medium), ("SMALL (<100)", small)]:
         if group:
             logger.info(f"\n  {label}: {len(group)} sessions")
@@ -168,16 +246,19 @@ def main():
 
     args = parser.parse_args()
 
+    # Scan once; the default view reports status and next from the same list
+    sessions = get_all_sessions()
+
     if args.status:
-        show_status()
+        show_status(sessions)
     elif args.next:
-        show_next()
+        show_next(sessions)
     elif args.queue:
-        show_queue()
+        show_queue(sessions)
     else:
-        show_status()
+        show_status(sessions)
         logger.info("")
-        show_next()
+        show_next(sessions)
 
 
 if __name__ == "__main__":
@@ -126,10 +126,10 @@ def _build_duplicate_skip_ids():
     if not CHAT_DIR.exists():
         return set()
     uuid_files = {}
-    for f in CHAT_DIR.iterdir():
-        if f.suffix != ".jsonl":
-            continue
-        stem = f.stem
+    with os.scandir(CHAT_DIR) as it:
+        names = [e.name for e in it if e.name.endswith(".jsonl")]
+    for name in names:
+        stem = name[:-len(".jsonl")]
         if '_' in stem and not stem.startswith('agent-'):
             prefix, uuid_part = stem.split('_', 1)
         else:
@@ -137,7 +137,7 @@ def _build_duplicate_skip_ids():
             uuid_part = stem
         if uuid_part not in uuid_files:
             uuid_files[uuid_part] = []
-        uuid_files[uuid_part].append({'prefix': prefix, 'short': f.stem[:8]})
+        uuid_files[uuid_part].append({'prefix': prefix, 'short': stem[:8]})
 
     skip_ids = set()
     for uuid_part, files in uuid_files.items():
@@ -1030,11 +1030,13 @@ def main():
     if args.session:
         session_dirs = [SESSIONS_DIR / args.session]
     else:
-        all_dirs = sorted(
-            d for d in SESSIONS_DIR.iterdir()
-            if d.is_dir() and d.name.startswith("session_")
-            and (d / "safe_condensed.json").exists()
-        )
+        with os.scandir(SESSIONS_DIR) as it:
+            entries = sorted((e for e in it if e.name.startswith("session_") and e.is_dir()),
+                             key=lambda e: e.name)
+        all_dirs = [
+            Path(e.path) for e in entries
+            if os.path.exists(os.path.join(e.path, "safe_condensed.json"))
+        ]
         # Skip duplicates
         session_dirs = [
             d for d in all_dirs
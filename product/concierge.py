@@ -9,18 +9,23 @@ Modes:
   --dashboard    Generate and open the dashboard
 """
 from tools.log_config import get_logger
+from tools.file_lock import atomic_json_dump
 
 logger = get_logger("product.concierge")
 
 import argparse
+import bisect
 import json
+import mmap
 import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from phase_0_prep.phase0_child import PHASE0_STEPS, phase0_child_source
 try:
     from config import OUTPUT_DIR as OUTPUT_BASE, REPO_ROOT as HYPERDOCS_ROOT, CLAUDE_SESSIONS_DIR as CLAUDE_PROJECTS
 except ImportError:
@@ -28,6 +33,29 @@ except ImportError:
     HYPERDOCS_ROOT = Path(__file__).resolve().parent.parent
     OUTPUT_BASE = Path(os.getenv("HYPERDOCS_OUTPUT_DIR", str(HYPERDOCS_ROOT / "output")))
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# orjson.loads takes str or bytes and raises orjson.JSONDecodeError, a
+# json.JSONDecodeError subclass, so callers catch the same exceptions.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# discovery.json and pipeline_status.json are machine-read, so they are
+# written compact; HYPERDOCS_PRETTY_JSON=1 indents them for inspection
+PRETTY_JSON = os.getenv("HYPERDOCS_PRETTY_JSON") == "1"
+
+
+def _json_dumps(data):
+    """Serialize to UTF-8 bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0)
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
 
 def format_size(size_bytes):
     if size_bytes >= 1_000_000:
@@ -37,22 +65,72 @@ def format_size(size_bytes):
     return f"{size_bytes} B"
 
 
+def format_mtime(mtime_ns):
+    """Local-time display string for a file mtime in nanoseconds."""
+    return datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y-%m-%d %H:%M")
+
+
+_ROLE_MARKERS = (
+    ("user", (b'"role":"user"', b'"role": "user"')),
+    ("assistant", (b'"role":"assistant"', b'"role": "assistant"')),
+)
+_MARKER_TAIL = max(len(m) for _, markers in _ROLE_MARKERS for m in markers) - 1
+
+
+_SCAN_CHUNK = 8 << 20  # bytes per window over the mapped file
+
+# A file shorter than the shortest role marker cannot hold a message, so
+# discover() records it as empty without opening it
+MIN_SESSION_BYTES = min(len(m) for _, markers in _ROLE_MARKERS for m in markers)
+
+
 def count_messages(jsonl_path):
-    """Count user and assistant messages in a JSONL file (fast, no full parse)."""
-    user = 0
-    assistant = 0
-    total = 0
+    """Count user and assistant messages in a JSONL file (fast, no full parse).
+
+    Counts the ASCII role markers with bytes.count instead of decoding and
+    testing each line; each message line carries one marker. The file is
+    memory-mapped with sequential read-ahead and scanned in fixed windows,
+    so memory stays flat however large the session is.
+    """
+    counts = {"total": 0, "user": 0, "assistant": 0}
     try:
-        with open(jsonl_path) as f:
-            for line in f:
-                total += 1
-                if '"role":"user"' in line or '"role": "user"' in line:
-                    user += 1
-                elif '"role":"assistant"' in line or '"role": "assistant"' in line:
-                    assistant += 1
-    except (OSError, UnicodeDecodeError):
+        with open(jsonl_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return counts
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                for start in range(0, size, _SCAN_CHUNK):
+                    # Window plus enough tail that a marker straddling the
+                    # boundary is counted here; the end bound passed to
+                    # count() keeps it from being counted again next window
+                    window = mm[start:start + _SCAN_CHUNK + _MARKER_TAIL]
+                    counts["total"] += window.count(b"\n", 0, _SCAN_CHUNK)
+                    for key, markers in _ROLE_MARKERS:
+                        for m in markers:
+                            counts[key] += window.count(m, 0, _SCAN_CHUNK + len(m) - 1)
+                if mm[size - 1:size] != b"\n":
+                    counts["total"] += 1
+    except (OSError, ValueError):
         pass
-    return {"total": total, "user": user, "assistant": assistant}
+    return counts
+
+
+def _load_cached_counts():
+    """Map session path -> session entry from the previous discovery.json, if any."""
+    discovery_path = OUTPUT_BASE / "discovery.json"
+    try:
+        with open(discovery_path, "rb") as f:
+            previous = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return {
+        s["path"]: s
+        for proj in previous.get("projects", {}).values()
+        for s in proj.get("sessions", [])
+        if "path" in s and "messages" in s
+    }
 
 
 def discover():
@@ -65,51 +143,87 @@ def discover():
     total_sessions = 0
     total_messages = 0
 
-    for project_dir in sorted(CLAUDE_PROJECTS.iterdir()):
-        if not project_dir.is_dir():
-            continue
+    # Collect every session file first, then count them all at once:
+    # files are independent, so the scans spread across processes
+    found = []
+    with os.scandir(CLAUDE_PROJECTS) as it:
+        project_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    for project_entry in project_entries:
+        # Directory mtime is taken before listing, so a file added after
+        # this point leaves the recorded mtime stale (see find_session)
+        dir_mtime_ns = project_entry.stat().st_mtime_ns
+        # One stat per file, taken from the DirEntry; paths stay plain str
+        # through the loop rather than allocating a Path per file
+        with os.scandir(project_entry.path) as it:
+            jsonls = [(e.path, e.name[:-len(".jsonl")], e.stat()) for e in it
+                      if e.name.endswith(".jsonl") and not e.name.startswith(".") and e.is_file()]
+        found.append((project_entry.name, project_entry.path, dir_mtime_ns, jsonls))
+
+    # Reuse counts from the previous discovery.json for files whose size and
+    # mtime are unchanged; only new or modified files are scanned
+    cached = _load_cached_counts()
+    known = {}
+    stale = []
+    for _, _, _, jsonls in found:
+        for jsonl, _, st in jsonls:
+            hit = cached.get(jsonl)
+            if st.st_size < MIN_SESSION_BYTES:
+                known[jsonl] = {"total": 0, "user": 0, "assistant": 0}
+            elif hit and hit.get("size_bytes") == st.st_size and hit.get("mtime_ns") == st.st_mtime_ns:
+                known[jsonl] = hit["messages"]
+            else:
+                stale.append(jsonl)
+    if len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            known.update(zip(stale, executor.map(count_messages, stale, chunksize=8)))
+    else:
+        known.update(zip(stale, map(count_messages, stale)))
 
+    for project_name, project_path, dir_mtime_ns, jsonls in found:
         sessions = []
-        for jsonl in project_dir.glob("*.jsonl"):
-            size = jsonl.stat().st_size
-            modified = datetime.fromtimestamp(jsonl.stat().st_mtime)
-            counts = count_messages(jsonl)
+        project_size = 0
+        project_total_msgs = 0
+        for jsonl, stem, st in jsonls:
+            size = st.st_size
+            counts = known[jsonl]
 
             # Skip files with no actual messages
             if counts["user"] == 0 and counts["assistant"] == 0:
                 continue
 
             sessions.append({
-                "id": jsonl.stem,
-                "path": str(jsonl),
+                "id": stem,
+                "path": jsonl,
                 "size_bytes": size,
+                "mtime_ns": st.st_mtime_ns,
                 "messages": counts,
-                "modified": modified.isoformat(),
-                "modified_display": modified.strftime("%Y-%m-%d %H:%M"),
             })
+            project_size += size
+            project_total_msgs += counts["total"]
+
+        if not sessions:
+            continue
+        sessions.sort(key=lambda s: s["mtime_ns"], reverse=True)
+
+        # Derive a readable project name from the encoded directory name
+        # -Users-name-Projects-project → extract last segment
+        readable = project_name.rpartition("-")[2]
+
+        projects[project_name] = {
+            "readable_name": readable,
+            "path": project_path,
+            "sessions": sessions,
+            "total_sessions": len(sessions),
+            "total_size": project_size,
+            "total_messages": project_total_msgs,
+            # Every .jsonl in the directory, empty ones included, so
+            # find_session can rule this project out without listing it
+            "mtime_ns": dir_mtime_ns,
+            "id_prefixes": sorted({stem[:8] for _, stem, _ in jsonls}),
+        }
+        total_sessions += len(sessions)
+        total_messages += project_total_msgs
 
-        if sessions:
-            sessions.sort(key=lambda s: s["modified"], reverse=True)
-
-            # Derive a readable project name from the encoded directory name
-            raw_name = project_dir.name
-            # -Users-name-Projects-project → extract last segment
-            parts = raw_name.split("-")
-            readable = parts[-1] if parts else raw_name
-
-            project_total_msgs = sum(s["messages"]["total"] for s in sessions)
-            projects[project_dir.name] = {
-                "readable_name": readable,
-                "path": str(project_dir),
-                "sessions": sessions,
-                "total_sessions": len(sessions),
-                "total_size": sum(s["size_bytes"] for s in sessions),
-                "total_messages": project_total_msgs,
-            }
-            total_sessions += len(sessions)
-            total_messages += project_total_msgs
-
-    # Write discovery.json
     discovery = {
         "discovered_at": datetime.now().isoformat(),
         "total_projects": len(projects),
@@ -118,10 +232,24 @@ def discover():
         "projects": projects,
     }
 
+    # Atomic replace, so the count cache read at the start of the next run
+    # never sees a half-written file
     OUTPUT_BASE.mkdir(parents=True, exist_ok=True)
     discovery_path = OUTPUT_BASE / "discovery.json"
-    with open(discovery_path, "w") as f:
-        json.dump(discovery, f, indent=2)
+    atomic_json_dump(discovery_path, _json_dumps(discovery))
+
+    # Small sidecar with just what find_session needs, so a lookup does not
+    # parse the whole discovery.json
+    atomic_json_dump(OUTPUT_BASE / "discovery_index.json", {
+        "sessions": {
+            s["id"]: {"id": s["id"], "path": s["path"], "project": key}
+            for key, proj in projects.items() for s in proj["sessions"]
+        },
+        "projects": {
+            key: {"mtime_ns": proj["mtime_ns"], "id_prefixes": proj["id_prefixes"]}
+            for key, proj in projects.items()
+        },
+    }, indent=None)
 
     # Print summary
     logger.info("=" * 60)
@@ -136,7 +264,7 @@ def discover():
         for s in proj["sessions"][:3]:
             user_msgs = s["messages"]["user"]
             asst_msgs = s["messages"]["assistant"]
-            logger.info(f"  {s['id'][:8]}  {s['modified_display']}  {format_size(s['size_bytes'])}  {user_msgs} user / {asst_msgs} assistant msgs")
+            logger.info(f"  {s['id'][:8]}  {format_mtime(s['mtime_ns'])}  {format_size(s['size_bytes'])}  {user_msgs} user / {asst_msgs} assistant msgs")
         if len(proj["sessions"]) > 3:
             logger.info(f"  ... and {len(proj['sessions']) - 3} more sessions")
         logger.info()
@@ -147,30 +275,66 @@ def discover():
     return discovery
 
 
+def _session_index(discovery):
+    """Build ({id: session}, sorted ids) so find_session can bisect on prefixes.
+
+    Accepts either discovery.json or the discovery_index.json sidecar.
+    """
+    if "sessions" in discovery:
+        by_id = discovery["sessions"]
+    else:
+        by_id = {
+            s["id"]: s
+            for proj in discovery.get("projects", {}).values()
+            for s in proj.get("sessions", [])
+        }
+    return by_id, sorted(by_id)
+
+
+def _has_prefix(sorted_strings, prefix):
+    """True if any string in the sorted list starts with prefix."""
+    i = bisect.bisect_left(sorted_strings, prefix)
+    return i < len(sorted_strings) and sorted_strings[i].startswith(prefix)
+
+
 def find_session(session_id, discovery=None):
     """Find a session file by ID (full or partial)."""
     if discovery is None:
-        discovery_path = OUTPUT_BASE / "discovery.json"
-        if discovery_path.exists():
-            with open(discovery_path) as f:
-                discovery = json.load(f)
+        # Prefer the sidecar index; older outputs only have discovery.json
+        for name in ("discovery_index.json", "discovery.json"):
+            discovery_path = OUTPUT_BASE / name
+            if discovery_path.exists():
+                with open(discovery_path, "rb") as f:
+                    discovery = _json_loads(f.read())
+                break
 
     if discovery:
-        for proj in discovery.get("projects", {}).values():
-            for s in proj.get("sessions", []):
-                if s["id"].startswith(session_id):
-                    return s
-
-    # Fallback: search directly
-    for project_dir in CLAUDE_PROJECTS.iterdir():
-        if not project_dir.is_dir():
-            continue
-        for jsonl in project_dir.glob(f"{session_id}*.jsonl"):
-            return {"id": jsonl.stem, "path": str(jsonl)}
+        by_id, sorted_ids = _session_index(discovery)
+        if session_id in by_id:
+            return by_id[session_id]
+        i = bisect.bisect_left(sorted_ids, session_id)
+        if i < len(sorted_ids) and sorted_ids[i].startswith(session_id):
+            return by_id[sorted_ids[i]]
+
+    # Fallback: search directly, skipping projects unchanged since discovery
+    # whose file ids cannot start with session_id
+    known = discovery.get("projects", {}) if discovery else {}
+    with os.scandir(CLAUDE_PROJECTS) as projects:
+        for project in projects:
+            if not project.is_dir():
+                continue
+            proj = known.get(project.name)
+            if (proj and "id_prefixes" in proj
+                    and proj.get("mtime_ns") == project.stat().st_mtime_ns
+                    and not _has_prefix(proj["id_prefixes"], session_id[:8])):
+                continue
+            with os.scandir(project.path) as entries:
+                for e in entries:
+                    if e.name.startswith(session_id) and e.name.endswith(".jsonl"):
+                        return {"id": e.name[:-len(".jsonl")], "path": e.path}
 
     return None
 
-
 def process(session_id):
     """Run Phase 0 on a specific session."""
     session = find_session(session_id)
@@ -201,28 +365,17 @@ def process(session_id):
 
     phase0_dir = HYPERDOCS_ROOT / "phase_0_prep"
 
-    # Run enrich_session.py
+    # Run enrich_session.py then prepare_agent_data.py in one interpreter;
+    # the exit status names the step that failed
     logger.info("--- Phase 0a: Deterministic Prep ---")
     result = subprocess.run(
-        [sys.executable, str(phase0_dir / "enrich_session.py")],
+        [sys.executable, "-c", phase0_child_source(banner="--- Phase 0b: Prepare Agent Data ---")],
         env=env,
         cwd=str(phase0_dir),
     )
     if result.returncode != 0:
-        logger.error("ERROR: enrich_session.py failed")
-        update_status(short_id, "phase_0", "FAILED")
-        return False
-
-    # Run prepare_agent_data.py
-    logger.info()
-    logger.info("--- Phase 0b: Prepare Agent Data ---")
-    result = subprocess.run(
-        [sys.executable, str(phase0_dir / "prepare_agent_data.py")],
-        env=env,
-        cwd=str(phase0_dir),
-    )
-    if result.returncode != 0:
-        logger.error("ERROR: prepare_agent_data.py failed")
+        step = PHASE0_STEPS.get(result.returncode, "phase 0")
+        logger.error(f"ERROR: {step} failed")
         update_status(short_id, "phase_0", "FAILED")
         return False
 
@@ -247,8 +400,8 @@ def update_status(session_short, phase, state):
     status_path = OUTPUT_BASE / f"session_{session_short}" / "pipeline_status.json"
     status = {}
     if status_path.exists():
-        with open(status_path) as f:
-            status = json.load(f)
+        with open(status_path, "rb") as f:
+            status = _json_loads(f.read())
 
     status[phase] = {
         "state": state,
@@ -256,9 +409,8 @@ def update_status(session_short, phase, state):
     }
     status["session_id"] = session_short
 
-    with open(status_path, "w") as f:
-        json.dump(status, f, indent=2)
-
+    # Temp file + rename, so a killed run never leaves a truncated status
+    atomic_json_dump(status_path, _json_dumps(status))
 
 def show_status():
     """Show pipeline state for the most recent session."""
@@ -267,17 +419,15 @@ def show_status():
         logger.info("No output directory found. Run --discover first.")
         return
 
-    session_dirs = sorted(
-        [d for d in OUTPUT_BASE.iterdir() if d.is_dir() and d.name.startswith("session_")],
-        key=lambda d: d.stat().st_mtime,
-        reverse=True,
-    )
+    # DirEntry caches its type and stat, so each directory is stat'ed once
+    with os.scandir(OUTPUT_BASE) as it:
+        session_dirs = [e for e in it if e.name.startswith("session_") and e.is_dir()]
 
     if not session_dirs:
         logger.info("No sessions processed yet. Run --process first.")
         return
 
-    latest = session_dirs[0]
+    latest = Path(max(session_dirs, key=lambda e: e.stat().st_mtime).path)
     status_path = latest / "pipeline_status.json"
 
     logger.info("=" * 60)
@@ -285,8 +435,8 @@ def show_status():
     logger.info("=" * 60)
 
     if status_path.exists():
-        with open(status_path) as f:
-            status = json.load(f)
+        with open(status_path, "rb") as f:
+            status = _json_loads(f.read())
     else:
         status = {}
 
@@ -320,16 +470,20 @@ def show_status():
     # Check what output files exist
     logger.info()
     logger.info("Output files:")
-    for f in sorted(latest.iterdir()):
-        if f.is_file() and not f.name.startswith("."):
-            logger.info(f"  {f.name} ({format_size(f.stat().st_size)})")
+    with os.scandir(latest) as it:
+        files = sorted((e for e in it if not e.name.startswith(".") and e.is_file()),
+                       key=lambda e: e.name)
+    for e in files:
+        logger.info(f"  {e.name} ({format_size(e.stat().st_size)})")
 
 
 def open_dashboard():
     """Generate and open the dashboard."""
     dashboard_script = HYPERDOCS_ROOT / "product" / "dashboard.py"
     if dashboard_script.exists():
-        subprocess.run([sys.executable, str(dashboard_script)])
+        # Same package, so run it in this interpreter rather than a new one
+        from product import dashboard
+        dashboard.main()
     else:
         logger.info("Dashboard not yet built. Coming soon.")
 
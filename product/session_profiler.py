@@ -14,11 +14,11 @@ Usage:
     python3 session_profiler.py --output /path.html # Custom output location
 """
 import json
-import os
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
 from collections import defaultdict
+from tools.browser import open_in_browser
 from tools.log_config import get_logger
 
 logger = get_logger("product.session_profiler")
@@ -609,9 +609,6 @@ def main():
     logger.info(f"\nVisualization: {output_path}")
     logger.info(f"  Size: {output_path.stat().st_size // 1024} KB")
 
-    # Auto-open
-    os.system(f'open "{output_path}"')
-
     # Also save raw profile data
     profile_path = output_path.with_suffix(".json")
     with open(profile_path, "w") as f:
@@ -623,6 +620,13 @@ def main():
         }, f, indent=2, default=str)
     logger.info(f"  Profile data: {profile_path}")
 
+    # Auto-open without waiting on the browser; a missing launcher only
+    # costs the preview, the files above are already written.
+    try:
+        open_in_browser(output_path)
+    except OSError as e:
+        logger.warning(f"  Could not open browser: {e}")
+
 
 if __name__ == "__main__":
     main()
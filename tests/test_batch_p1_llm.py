@@ -0,0 +1,230 @@
+"""Tests for batch_p1_llm.py — batch LLM pass orchestration."""
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from phase_1_extraction import batch_p1_llm
+
+
+class RecordingBucket:
+    """Stand-in for TokenBucket that never sleeps and records penalties."""
+
+    def __init__(self):
+        self.penalties = []
+
+    def acquire(self):
+        pass
+
+    def penalize(self, seconds):
+        self.penalties.append(seconds)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """Retry immediately and swap in a non-blocking Haiku bucket."""
+    bucket = RecordingBucket()
+    monkeypatch.setattr(batch_p1_llm, "RETRY_BASE", 0)
+    monkeypatch.setattr(batch_p1_llm, "RETRY_JITTER", 0)
+    monkeypatch.setattr(batch_p1_llm, "HAIKU_BUCKET", bucket)
+    return bucket
+
+
+def _write_session(session_dir):
+    """Minimal enriched session with one message that Pass 1 analyzes."""
+    session_dir.mkdir(parents=True)
+    (session_dir / "enriched_session.json").write_text(json.dumps({
+        "session_id": session_dir.name,
+        "messages": [{"index": 0, "role": "assistant", "filter_tier": 3,
+                      "content": "Refactored the loader."}],
+    }))
+
+
+class TestRunPassOnSessionRetry:
+    """Transient API failures are retried; the pass output is only written on success."""
+
+    def test_rate_limit_is_retried_then_succeeds(self, tmp_path, monkeypatch, no_backoff, capsys):
+        anthropic = pytest.importorskip("anthropic")
+        httpx = pytest.importorskip("httpx")
+        runner = batch_p1_llm._llm_pass_runner()
+        monkeypatch.setattr(runner, "MAX_RETRIES", 1)
+        monkeypatch.setattr(runner, "RETRY_DELAY_BASE", 0)
+
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs["model"])
+            if len(calls) == 1:
+                request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+                raise anthropic.RateLimitError(
+                    "Error code: 429 - rate_limit_error",
+                    response=httpx.Response(429, request=request), body=None)
+            return SimpleNamespace(
+                usage=SimpleNamespace(input_tokens=100, output_tokens=20),
+                content=[SimpleNamespace(text='[{"index": 0}]')],
+            )
+
+        monkeypatch.setattr(runner, "client",
+                            SimpleNamespace(messages=SimpleNamespace(create=create)))
+        session_dir = tmp_path / "session_aaaa1111"
+        _write_session(session_dir)
+
+        result = batch_p1_llm.run_pass_on_session(session_dir, 1)
+
+        assert result["success"] is True
+        assert result["input_tokens"] == 100
+        assert len(calls) == 2
+        assert no_backoff.penalties, "a 429 should slow the whole bucket"
+        # "Rate limited ..." and "Batch 1/1 ..." stay off the orchestrator's stdout
+        assert capsys.readouterr().out == ""
+        output = json.loads((session_dir / "llm_pass1_content_ref.json").read_text())
+        assert output["results"] == [{"index": 0}]
+
+    def test_rate_limit_exhausted_is_failure_without_output(self, tmp_path, monkeypatch, no_backoff):
+        anthropic = pytest.importorskip("anthropic")
+        httpx = pytest.importorskip("httpx")
+        runner = batch_p1_llm._llm_pass_runner()
+        monkeypatch.setattr(runner, "MAX_RETRIES", 1)
+        monkeypatch.setattr(runner, "RETRY_DELAY_BASE", 0)
+
+        def create(**kwargs):
+            request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+            raise anthropic.RateLimitError(
+                "Error code: 429 - rate_limit_error",
+                response=httpx.Response(429, request=request), body=None)
+
+        monkeypatch.setattr(runner, "client",
+                            SimpleNamespace(messages=SimpleNamespace(create=create)))
+        session_dir = tmp_path / "session_bbbb2222"
+        _write_session(session_dir)
+
+        result = batch_p1_llm.run_pass_on_session(session_dir, 1)
+
+        assert result["success"] is False
+        assert "429" in result["error"]
+        assert not (session_dir / "llm_pass1_content_ref.json").exists()
+
+    def test_non_transient_error_fails_fast(self, tmp_path, monkeypatch, no_backoff):
+        calls = []
+
+        def run_single_pass(session_dir, pass_num, dry_run=False, quiet=False):
+            calls.append(pass_num)
+            raise ValueError("Pass 9 not found")
+
+        monkeypatch.setattr(batch_p1_llm, "_llm_pass_runner",
+                            lambda: SimpleNamespace(run_single_pass=run_single_pass))
+
+        result = batch_p1_llm.run_pass_on_session(tmp_path / "session_cccc3333", 1)
+
+        assert result["success"] is False
+        assert calls == [1]
+        assert no_backoff.penalties == []
+
+
+class TestMergeSession:
+    """merge_session skips unchanged inputs and reports failures instead of raising."""
+
+    def test_skips_when_inputs_unchanged(self, tmp_path):
+        session_dir = tmp_path / "session_ffff6666"
+        _write_session(session_dir)
+        pass1 = session_dir / "llm_pass1_content_ref.json"
+        pass1.write_text(json.dumps({"results": [{"index": 0, "content_referential": True}]}))
+
+        first = batch_p1_llm.merge_session(session_dir)
+        assert first["success"] is True and first["skipped"] is False
+        assert (session_dir / "enriched_session_v2.json").exists()
+
+        assert batch_p1_llm.merge_session(session_dir)["skipped"] is True
+        assert batch_p1_llm.merge_session(session_dir, force=True)["skipped"] is False
+
+        pass1.write_text(json.dumps({"results": [{"index": 0, "content_referential": False}]}))
+        assert batch_p1_llm.merge_session(session_dir)["skipped"] is False
+        assert batch_p1_llm.merge_session(session_dir)["skipped"] is True
+
+    def test_unexpected_error_is_recorded_not_raised(self, tmp_path):
+        session_dir = tmp_path / "session_dddd4444"
+        _write_session(session_dir)
+        # A top-level list where a results object is expected: AttributeError
+        (session_dir / "llm_pass1_content_ref.json").write_text('[{"index": 0}]')
+
+        result = batch_p1_llm.merge_session(session_dir)
+
+        assert result["success"] is False
+        assert result["error"].startswith("AttributeError")
+        assert not (session_dir / batch_p1_llm.MERGE_DIGEST_FILE).exists()
+
+
+class TestCheckpointWriter:
+    """The writer thread outlives a result it cannot record."""
+
+    def test_bad_result_does_not_stop_later_saves(self, monkeypatch):
+        saved = []
+        monkeypatch.setattr(batch_p1_llm, "update_cost_log", lambda *args: None)
+        monkeypatch.setattr(batch_p1_llm, "save_checkpoint",
+                            lambda checkpoint: saved.append(dict(checkpoint)))
+        good = {"session": "session_eeee5555", "pass": 1, "success": True,
+                "dry_run": False, "cost": 0.5, "elapsed": 1.0}
+
+        checkpoint = {}
+        with batch_p1_llm.CheckpointWriter(checkpoint) as writer:
+            writer.put({"session": "session_bad", "success": True})  # no "dry_run": KeyError
+            writer.put(good)
+
+        assert writer.failed == 1
+        assert "session_eeee5555" in checkpoint["completed_sessions"]["pass1"]
+        assert saved and saved[-1]["total_cost"] == 0.5
+
+
+@pytest.fixture
+def cost_log(tmp_path, monkeypatch):
+    """Point the JSONL and legacy cost logs into tmp_path."""
+    monkeypatch.setattr(batch_p1_llm, "CHECKPOINT_DIR", tmp_path)
+    monkeypatch.setattr(batch_p1_llm, "COST_LOG_FILE", tmp_path / "llm_pass_cost_log.jsonl")
+    monkeypatch.setattr(batch_p1_llm, "LEGACY_COST_LOG_FILE", tmp_path / "llm_pass_cost_log.json")
+    return tmp_path
+
+
+class TestCostLog:
+    """JSONL cost log and its one-time migration from the legacy JSON array."""
+
+    LEGACY = [{"timestamp": "2026-01-01T00:00:00+00:00", "pass": 2,
+               "session": "session_old", "cost": 1.25, "model": "Opus"}]
+
+    def test_migrate_prepends_legacy_entries_once(self, cost_log):
+        batch_p1_llm.LEGACY_COST_LOG_FILE.write_text(json.dumps(self.LEGACY))
+        batch_p1_llm.update_cost_log(1, "session_new", 0.5, "Haiku")
+
+        batch_p1_llm.migrate_cost_log()
+        batch_p1_llm.migrate_cost_log()
+
+        assert not batch_p1_llm.LEGACY_COST_LOG_FILE.exists()
+        lines = batch_p1_llm.COST_LOG_FILE.read_text().splitlines()
+        assert [json.loads(line)["session"] for line in lines] == ["session_old", "session_new"]
+        entries = batch_p1_llm.read_cost_log()
+        assert batch_p1_llm.entry_time(entries[0]) == "2026-01-01T00:00:00+00:00"
+        assert batch_p1_llm.entry_time(entries[1]).endswith("+00:00")
+
+    def test_read_includes_unmigrated_legacy_without_writing(self, cost_log):
+        batch_p1_llm.LEGACY_COST_LOG_FILE.write_text(json.dumps(self.LEGACY))
+        batch_p1_llm.update_cost_log(1, "session_new", 0.5, "Haiku")
+        before = sorted(p.name for p in cost_log.iterdir())
+
+        entries = batch_p1_llm.read_cost_log()
+
+        assert [e["session"] for e in entries] == ["session_old", "session_new"]
+        assert sorted(p.name for p in cost_log.iterdir()) == before
+
+    def test_status_does_not_migrate(self, cost_log, monkeypatch):
+        batch_p1_llm.LEGACY_COST_LOG_FILE.write_text(json.dumps(self.LEGACY))
+        monkeypatch.setattr(batch_p1_llm, "show_status", lambda: None)
+        monkeypatch.setattr(sys, "argv", ["batch_p1_llm.py", "--status"])
+
+        batch_p1_llm.main()
+
+        assert batch_p1_llm.LEGACY_COST_LOG_FILE.exists()
+        assert not batch_p1_llm.COST_LOG_FILE.exists()
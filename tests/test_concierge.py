@@ -0,0 +1,92 @@
+"""Tests for product/concierge.py — session discovery and lookup."""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from product import concierge
+
+
+class _QuietLogger:
+    """discover() prints a report through logger.info(), blank lines included."""
+
+    def info(self, *args):
+        pass
+
+    error = warning = info
+
+
+def _write_session(path, roles, mtime):
+    path.write_text("".join(json.dumps({"message": {"role": r}}) + "\n" for r in roles))
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def projects(tmp_path, monkeypatch):
+    """Two Claude Code project dirs and an empty output dir."""
+    root = tmp_path / "projects"
+    alpha = root / "-Users-x-Projects-alpha"
+    beta = root / "-Users-x-Projects-beta"
+    alpha.mkdir(parents=True)
+    beta.mkdir()
+    _write_session(alpha / "aaaa1111-0000.jsonl", ["user", "assistant"], 1_700_000_000)
+    _write_session(beta / "bbbb2222-0000.jsonl", ["user", "assistant", "assistant"], 1_700_000_100)
+    monkeypatch.setattr(concierge, "CLAUDE_PROJECTS", root)
+    monkeypatch.setattr(concierge, "OUTPUT_BASE", tmp_path / "output")
+    monkeypatch.setattr(concierge, "logger", _QuietLogger())
+    return root
+
+
+class TestDiscover:
+    """discover() reuses message counts for files whose size and mtime are unchanged."""
+
+    def test_writes_discovery_and_index(self, projects):
+        discovery = concierge.discover()
+
+        assert discovery["total_sessions"] == 2
+        assert discovery["total_messages"] == 5
+        on_disk = json.loads((concierge.OUTPUT_BASE / "discovery.json").read_text())
+        assert on_disk["total_projects"] == 2
+        assert on_disk["projects"]["-Users-x-Projects-alpha"]["readable_name"] == "alpha"
+        index = json.loads((concierge.OUTPUT_BASE / "discovery_index.json").read_text())
+        assert set(index["sessions"]) == {"aaaa1111-0000", "bbbb2222-0000"}
+
+    def test_unchanged_file_is_not_rescanned(self, projects):
+        session = projects / "-Users-x-Projects-alpha" / "aaaa1111-0000.jsonl"
+        concierge.discover()
+
+        # Same size and mtime, different roles: only a rescan would notice
+        _write_session(session, ["assistant", "tool"], 1_700_000_000)
+        cached = concierge.discover()
+        counts = cached["projects"]["-Users-x-Projects-alpha"]["sessions"][0]["messages"]
+        assert counts == {"total": 2, "user": 1, "assistant": 1}
+
+        os.utime(session, (1_700_000_500, 1_700_000_500))
+        rescanned = concierge.discover()
+        counts = rescanned["projects"]["-Users-x-Projects-alpha"]["sessions"][0]["messages"]
+        assert counts == {"total": 2, "user": 0, "assistant": 1}
+
+
+class TestFindSession:
+    """find_session resolves full ids, prefixes, and files added after discovery."""
+
+    def test_full_id_and_prefix(self, projects):
+        concierge.discover()
+
+        assert concierge.find_session("bbbb2222-0000")["project"] == "-Users-x-Projects-beta"
+        assert concierge.find_session("aaaa")["id"] == "aaaa1111-0000"
+        assert concierge.find_session("cccc") is None
+
+    def test_falls_back_to_scanning_projects(self, projects):
+        concierge.discover()
+        late = projects / "-Users-x-Projects-beta" / "cccc3333-0000.jsonl"
+        _write_session(late, ["user"], 1_700_000_200)
+
+        found = concierge.find_session("cccc3333")
+
+        assert found == {"id": "cccc3333-0000", "path": str(late)}
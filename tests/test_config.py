@@ -102,3 +102,22 @@ class TestHelpers:
             # Should return None (not crash) when session doesn't exist
             assert result is None or isinstance(result, Path)
             del sys.modules["config"]
+
+    def test_get_session_file_searches_project_dirs(self, tmp_path):
+        """Without PROJECT_ID, a short ID should match a file in any project dir."""
+        project = tmp_path / ".claude" / "projects" / "-Users-x-proj"
+        project.mkdir(parents=True)
+        session = project / "abcdef12-3456-7890.jsonl"
+        session.write_text("{}\n")
+        (project / "abcdef99.jsonl").write_text("{}\n")
+        with mock.patch.dict(os.environ, {
+            "HOME": str(tmp_path),
+            "HYPERDOCS_SESSION_ID": "abcdef12",
+            "HYPERDOCS_CHAT_HISTORY": "",
+            "HYPERDOCS_PROJECT_ID": "",
+        }):
+            if "config" in sys.modules:
+                del sys.modules["config"]
+            import config
+            assert config.get_session_file() == session
+            del sys.modules["config"]
@@ -0,0 +1,73 @@
+"""Tests for tools/file_lock.py — atomic writes and temp-file cleanup."""
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.file_lock import TMP_MARKER, atomic_json_dump, sweep_tmp_files
+
+
+def _dead_pid():
+    """Pid of a process that has already exited."""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def _tmp_file(directory, pid, age):
+    path = directory / f"llm_pass1_content_ref.json{TMP_MARKER}{pid}.1"
+    path.write_text("{")
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+class TestAtomicJsonDump:
+    """atomic_json_dump writes objects or pre-serialized bytes."""
+
+    def test_writes_bytes_as_is(self, tmp_path):
+        target = tmp_path / "status.json"
+        atomic_json_dump(target, b'{"a":1}')
+        assert target.read_bytes() == b'{"a":1}'
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_serializes_objects(self, tmp_path):
+        target = tmp_path / "status.json"
+        atomic_json_dump(target, {"a": 1}, indent=None)
+        assert json.loads(target.read_text()) == {"a": 1}
+
+
+class TestSweepTmpFiles:
+    """Only temp files whose writer is gone, and that are not recent, are stale."""
+
+    def test_removes_old_file_of_dead_writer(self, tmp_path):
+        stale = _tmp_file(tmp_path, _dead_pid(), age=3600)
+        assert sweep_tmp_files(tmp_path) == 1
+        assert not stale.exists()
+
+    def test_keeps_file_of_live_writer(self, tmp_path):
+        live = _tmp_file(tmp_path, os.getpid(), age=3600)
+        assert sweep_tmp_files(tmp_path) == 0
+        assert live.exists()
+
+    def test_keeps_recent_file_of_dead_writer(self, tmp_path):
+        recent = _tmp_file(tmp_path, _dead_pid(), age=5)
+        assert sweep_tmp_files(tmp_path) == 0
+        assert recent.exists()
+
+    def test_keeps_files_not_written_by_atomic_json_dump(self, tmp_path):
+        others = [tmp_path / name for name in
+                  ("report.tmp.json", "notes.tmp.1.txt", f"a.json{TMP_MARKER}{_dead_pid()}")]
+        for path in others:
+            path.write_text("{}")
+            os.utime(path, (time.time() - 3600,) * 2)
+        assert sweep_tmp_files(tmp_path) == 0
+        assert all(path.exists() for path in others)
+
+    def test_missing_directory(self, tmp_path):
+        assert sweep_tmp_files(tmp_path / "gone") == 0
@@ -0,0 +1,56 @@
+"""Tests for phase_0_prep/geological_reader.py — parallel JSONL parsing."""
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from phase_0_prep import geological_reader
+
+
+def _write_jsonl(path, session_id, count, day):
+    lines = [json.dumps({"type": "queue-operation"}), "not json"]
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        lines.append(json.dumps({
+            "type": role,
+            "sessionId": session_id,
+            "timestamp": f"2026-01-{day:02d}T00:{i:02d}:00Z",
+            "message": {"role": role, "content": [{"type": "text", "text": f"{path.stem}-{i}"}]},
+        }))
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestParallelParsing:
+    """The reader bound after import parses files across a process pool."""
+
+    def test_parse_all_files_one_session_per_file_in_order(self, tmp_path):
+        assert hasattr(geological_reader.GeologicalReader, "parse_all_files")
+        files = []
+        for k, count in enumerate((3, 5, 2)):
+            path = tmp_path / f"file{k}.jsonl"
+            _write_jsonl(path, f"S{k}", count, day=k + 1)
+            files.append(path)
+        reader = geological_reader.GeologicalReader(str(tmp_path))
+
+        sessions = reader.parse_all_files(files)
+
+        assert [s.session_id for s in sessions] == ["file0", "file1", "file2"]
+        assert [s.message_count for s in sessions] == [3, 5, 2]
+        assert sessions[1].messages[4].content == "file1-4"
+        assert sessions[2].start_time.day == 3
+
+    def test_load_all_sessions_groups_by_session_id(self, tmp_path):
+        _write_jsonl(tmp_path / "a.jsonl", "shared", 4, day=2)
+        _write_jsonl(tmp_path / "b.jsonl", "shared", 2, day=1)
+        _write_jsonl(tmp_path / "c.jsonl", "alone", 3, day=5)
+        reader = geological_reader.GeologicalReader(str(tmp_path))
+
+        sessions = reader.load_all_sessions()
+
+        assert sorted(sessions) == ["alone", "shared"]
+        shared = sessions["shared"]
+        assert shared.message_count == 6
+        assert shared.messages[0].content == "b-0"  # sorted by timestamp
+        assert shared.end_time.day == 2
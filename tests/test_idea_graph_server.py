@@ -0,0 +1,61 @@
+"""Tests for tools/idea_graph_explorer/server.py — GET response caching."""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.idea_graph_explorer import server
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache(monkeypatch):
+    monkeypatch.setattr(server, "_response_cache", {})
+    monkeypatch.setattr(server, "_build_locks", {})
+
+
+class TestCachedResponse:
+    """One build per key; a slow build never blocks other keys."""
+
+    def test_slow_build_does_not_block_other_keys(self):
+        started = threading.Event()
+        release = threading.Event()
+        builds = []
+
+        def slow_build():
+            builds.append("slow")
+            started.set()
+            release.wait(5)
+            return {"graph": "all"}
+
+        results = []
+        workers = [threading.Thread(target=lambda: results.append(
+            server._cached_response("/api/graph/all", slow_build))) for _ in range(2)]
+        workers[0].start()
+        assert started.wait(5)
+        workers[1].start()
+
+        # Served while /api/graph/all is still building
+        other = server._cached_response("/api/sessions", lambda: {"sessions": []})
+        assert other is not None and not release.is_set()
+
+        release.set()
+        for w in workers:
+            w.join(5)
+        assert builds == ["slow"]
+        assert len(results) == 2 and results[0] == results[1]
+
+    def test_missing_entry_is_not_cached(self):
+        assert server._cached_response("/api/graph/none", lambda: None) is None
+        assert "/api/graph/none" not in server._response_cache
+        assert "/api/graph/none" not in server._build_locks
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(server, "RESPONSE_CACHE_MAX", 4)
+        for i in range(10):
+            server._cached_response(f"/api/graph/{i}", lambda: {"i": 1})
+        assert len(server._response_cache) == 4
+        assert len(server._build_locks) == 4
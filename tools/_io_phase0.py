@@ -51,19 +51,25 @@ PHASE0_IO = {
 
     # ── batch_phase0_reprocess.py ─────────────────────────────────────────────
     # Batch reprocessor: iterates all sessions with enriched_session.json,
-    # finds the source JSONL for each, and spawns enrich_session.py +
-    # prepare_agent_data.py as subprocesses. Also spawns schema_normalizer
+    # finds the source JSONL for each, and runs enrich_session.py +
+    # prepare_agent_data.py (via runpy, see phase0_child.py) in one child
+    # process per session, with sessions run in parallel on a thread pool.
+    # Also spawns schema_normalizer
     # and completeness_scanner. Writes a completion log.
     "phase_0_prep/batch_phase0_reprocess.py": {
         "reads": [
-            "{CHAT_DIR}/*.jsonl",                        # _build_duplicate_set() + find_jsonl_for_session()
+            "{CHAT_DIR}/*.jsonl",                        # _scan_chat_dir() — one scandir for duplicates + lookup
+            "{INDEXES_DIR}/duplicate_skip_ids.json",     # load_chat_index() — cache keyed by CHAT_DIR mtime
             "{session}/enriched_session.json",           # main() — existence check to find sessions
         ],
         "writes": [
+            "{INDEXES_DIR}/duplicate_skip_ids.json",     # load_chat_index() — rewritten on cache miss
             "{INDEXES_DIR}/phase0_reprocess_log.json",   # main() — written at end
         ],
         "imports_from": [
             "config",
+            "phase_0_prep.phase0_child",
+            "tools.file_lock",
             "tools.log_config",
         ],
     },
@@ -160,17 +166,19 @@ PHASE0_IO = {
     # The Opus-per-line methods (opus_parse_message, opus_analyze_session,
     # load_all_sessions, opus_get_statistics) are DEPRECATED stubs that raise
     # NotImplementedError. Active method: deterministic_parse_message() (pure Python).
-    # GeologicalReader.discover_jsonl_files() uses Path.glob("**/*.jsonl") on
-    # self.chat_dir passed by the caller.
-    # log_api_call() (writes api_call_log.json) is DISABLED — returns immediately at line 54.
+    # GeologicalReader.discover_jsonl_files() walks self.chat_dir (passed by the
+    # caller) with os.scandir, matching names against JSONL_SUFFIXES.
+    # log_api_call() (appends to api_call_log.jsonl) is DISABLED — returns immediately.
     # The standalone main() opens files[0] directly for reading as a test.
+    # The GeologicalReader bound after import reads whole files on a process
+    # pool (parse_all_files, load_all_sessions via _read_file_messages).
     "phase_0_prep/geological_reader.py": {
         "reads": [
             "{chat_dir}/**/*.jsonl",                     # discover_jsonl_files() + standalone main()
             ".env",                                      # dotenv.load_dotenv() — walks up from file location
         ],
         "writes": [
-            # api_call_log.json write is DISABLED — log_api_call() returns at line 54
+            # api_call_log.jsonl append is DISABLED — log_api_call() returns early
         ],
         "imports_from": [
             "tools.log_config",
@@ -180,15 +188,16 @@ PHASE0_IO = {
     # ── llm_pass_runner.py ────────────────────────────────────────────────────
     # Core infrastructure for running one LLM pass on one session.
     # load_enriched_session() prefers safe_condensed.json, falls back to enriched_session.json.
-    # run_all_passes() and the CLI main() load llm_pass1_content_ref.json from disk
+    # run_all_passes() and run_single_pass() (used by the CLI and batch_p1_llm) load llm_pass1_content_ref.json from disk
     # when pass 3 is requested without having run pass 1 in the same invocation.
-    # run_pass() writes one output file per pass per session (defined in PASS_CONFIGS).
+    # run_pass() writes one output file per pass per session (defined in PASS_CONFIGS),
+    # atomically via tools.file_lock.atomic_json_dump (temp file + os.replace).
     # ENV loading: reads .env files from up to 3 candidate paths (REPO/.env, etc.).
     "phase_0_prep/llm_pass_runner.py": {
         "reads": [
             "{session}/safe_condensed.json",             # load_enriched_session() — preferred
             "{session}/enriched_session.json",           # load_enriched_session() — fallback
-            "{session}/llm_pass1_content_ref.json",      # run_all_passes() / CLI main() — pass 3 prerequisite
+            "{session}/llm_pass1_content_ref.json",      # run_all_passes() / run_single_pass() — pass 3 prerequisite
             ".env",                                      # ENV_CANDIDATES loader at module level
         ],
         "writes": [
@@ -200,6 +209,7 @@ PHASE0_IO = {
         "imports_from": [
             "config",
             "phase_0_prep.prompts",
+            "tools.file_lock",
             "tools.log_config",
         ],
     },
@@ -221,6 +231,7 @@ PHASE0_IO = {
         "imports_from": [
             "config",
             "phase_0_prep.prompts",
+            "tools.file_lock",
             "tools.log_config",
         ],
     },
@@ -314,6 +325,17 @@ PHASE0_IO = {
         ],
     },
 
+    # ── phase0_child.py ───────────────────────────────────────────────────────
+    # Pure library: the `python -c` source that runs enrich_session.py and
+    # prepare_agent_data.py through runpy in one child interpreter, and the
+    # exit-status -> step map. Shared by batch_phase0_reprocess.py and
+    # product/concierge.py. No file I/O of its own. No pipeline imports.
+    "phase_0_prep/phase0_child.py": {
+        "reads": [],
+        "writes": [],
+        "imports_from": [],
+    },
+
     # ── prompts.py ────────────────────────────────────────────────────────────
     # Pure library: prompt strings (PASS1_SYSTEM … PASS4_USER_TEMPLATE) and
     # PASS_CONFIGS registry. format_messages_for_prompt() and
@@ -37,31 +37,40 @@ PHASE1_2_IO = {
     "phase_1_extraction/batch_p1_llm.py": {
         # Batch LLM orchestrator: runs 4 LLM passes (pass1-pass4) across all
         # sessions. Delegates actual API calls to phase_0_prep/llm_pass_runner.py
-        # and phase_0_prep/merge_llm_results.py via subprocess.  Does NOT read or
-        # write session payload files directly; the subprocesses do that.
+        # (run_single_pass) and merging to phase_0_prep/merge_llm_results.py
+        # (merge_session), both called in-process.  Does NOT read or write
+        # session payload files directly; those functions do that.
         "reads": [
-            # Session discovery: OUTPUT_DIR.iterdir(), checks .exists() (lines 97-102)
+            # Session discovery: cached os.scandir(OUTPUT_DIR) + threaded .exists() probes (_scan_sessions)
             "{session_dir}/enriched_session.json",
-            # Pass completion marker checks: (s / output_file).exists() (lines 108-109)
+            # Pass completion markers: one os.scandir per session (session_files)
             "{session_dir}/llm_pass1_content_ref.json",
             "{session_dir}/llm_pass2_behaviors.json",
             "{session_dir}/llm_pass3_intent.json",
             "{session_dir}/llm_pass4_importance.json",
-            # Merged output existence check in show_status (line 335)
+            # Merged output check in show_status (same scandir name set)
             "{session_dir}/enriched_session_v2.json",
+            # merge_session(): digest of the merge inputs at the last merge (skip if unchanged)
+            "{session_dir}/enriched_session_v2.merge_inputs.sha256",
             # Checkpoint: open(CHECKPOINT_FILE) + json.load (lines 117-118)
             "{INDEXES_DIR}/llm_pass_checkpoint.json",
-            # Cost log: open(COST_LOG_FILE) + json.load (lines 133-135, line 341)
+            # Cost log: read_cost_log() line-by-line JSONL read (show_status)
+            "{INDEXES_DIR}/llm_pass_cost_log.jsonl",
+            # Legacy JSON-array cost log: read by read_cost_log() until a run
+            # that appends converts it once with migrate_cost_log()
             "{INDEXES_DIR}/llm_pass_cost_log.json",
         ],
         "writes": [
+            # merge_session(): input digest written after each successful merge
+            "{session_dir}/enriched_session_v2.merge_inputs.sha256",
             # Checkpoint: open(CHECKPOINT_FILE, 'w') + json.dump (lines 125-126)
             "{INDEXES_DIR}/llm_pass_checkpoint.json",
-            # Cost log: open(COST_LOG_FILE, 'w') + json.dump (lines 143-144)
-            "{INDEXES_DIR}/llm_pass_cost_log.json",
+            # Cost log: open(COST_LOG_FILE, 'a') one JSON line per call (update_cost_log)
+            "{INDEXES_DIR}/llm_pass_cost_log.jsonl",
         ],
         "imports_from": [
             "config",           # SESSIONS_STORE_DIR, INDEXES_DIR (lines 51-57)
+            "tools.file_lock",  # atomic_json_write, sweep_tmp_files
             "tools.log_config", # get_logger (line 44)
         ],
     },
@@ -8,12 +8,13 @@ open(), json.load(), json.loads(), read_text(), write_text(), json.dump(),
 Path.glob(), Path.rglob(), load_json(), save_json(), Workbook.save(),
 shutil.copy2(), and FileHandler instantiation found in the source.
 
-Files cataloged (24 qualifying files):
+Files cataloged (25 qualifying files):
   config.py
   tools/add_data_trace_sheets.py
   tools/analyze_data_flow.py
   tools/batch_phase3a.py
   tools/batch_runner.py
+  tools/browser.py
   tools/collect_visualizations.py
   tools/completeness_scanner.py
   tools/data_lifecycle.py
@@ -50,7 +51,7 @@ Path notation:
   {REPO}/         = hyperdocs_3 repo root
   {HOME}/         = ~/
 
-Generic utilities (file_lock.py, json_io.py, log_config.py) take all
+Generic utilities (browser.py, file_lock.py, json_io.py, log_config.py) take all
 paths from callers at runtime — their read/write lists are empty.
 """
 
@@ -58,10 +59,11 @@ TOOLS_IO = {
 
     # ── config.py ─────────────────────────────────────────────────
     # No file I/O of its own; defines path constants used by importers.
-    # _find_jsonl() performs glob searches to locate session JSONL files.
+    # _find_jsonl() checks the exact name, then lists the directory once
+    # (os.scandir) for prefix matches to locate session JSONL files.
     "config.py": {
         "reads": [
-            # _find_jsonl: directory.glob("{session_id}*.jsonl")
+            # _find_jsonl: {session_id}.jsonl, else scandir prefix match
             "~/.claude/projects/{project_id}/{session_id}*.jsonl",
             "~/PERMANENT_CHAT_HISTORY/sessions/{session_id}*.jsonl",
         ],
@@ -97,6 +99,15 @@ TOOLS_IO = {
         "imports_from": [],
     },
 
+    # ── tools/browser.py ──────────────────────────────────────────
+    # Generic utility — open_in_browser(target) hands a file path or URL
+    # to the platform launcher. Reads and writes nothing itself.
+    "tools/browser.py": {
+        "reads": [],
+        "writes": [],
+        "imports_from": [],
+    },
+
     # ── tools/run_pipeline.py ─────────────────────────────────────
     # Orchestrates pipeline phases. Calls phase scripts via subprocess.
     # Directly imports backfill_phase2 and writes Phase 2 outputs in-process.
@@ -275,6 +286,7 @@ TOOLS_IO = {
             "output/comparison_{stem}.json",
         ],
         "imports_from": [
+            "tools.browser",
             "tools.log_config",
         ],
     },
@@ -0,0 +1,37 @@
+"""
+Open a generated report or a local server URL in the user's browser.
+
+Usage:
+    from tools.browser import open_in_browser
+    try:
+        open_in_browser(output_path)
+    except OSError as e:
+        logger.warning(f"Could not open browser: {e}")
+
+The launcher runs detached with its output discarded, so callers never wait
+on the browser. A missing launcher raises OSError; callers decide how to
+report it, since the file or server is already usable without the preview.
+"""
+import subprocess
+import sys
+import webbrowser
+from pathlib import Path
+
+
+def open_in_browser(target):
+    """Open a file or URL with the platform launcher.
+
+    Args:
+        target: Path to a local file, or a URL string.
+
+    Raises:
+        OSError: if the launcher cannot be started.
+    """
+    if sys.platform == "darwin":
+        subprocess.Popen(["open", str(target)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elif sys.platform == "linux":
+        subprocess.Popen(["xdg-open", str(target)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        webbrowser.open(Path(target).resolve().as_uri() if isinstance(target, Path) else target)
@@ -4,6 +4,7 @@ Extract all visualization data from the Hyperdocs pipeline output.
 Produces dashboard_data.json with rich data for the interactive dashboard.
 """
 import json
+import os
 import re
 from pathlib import Path
 from collections import Counter, defaultdict
@@ -12,6 +13,11 @@ import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from tools.log_config import get_logger
 
+try:
+    import ijson
+except ImportError:  # optional: streaming metadata read; full json.loads is the fallback
+    ijson = None
+
 logger = get_logger("tools.extract_dashboard_data")
 
 BASE = Path(__file__).parent
@@ -19,6 +25,11 @@ HYPERDOCS = BASE / "hyperdocs"
 SESSIONS = BASE
 INDEX_FILE = BASE / "cross_session_file_index.json"
 
+P1_OUTPUTS = frozenset({"thread_extractions.json", "geological_notes.json",
+                        "semantic_primitives.json", "explorer_notes.json"})
+P2_OUTPUTS = frozenset({"idea_graph.json", "synthesis.json", "grounded_markers.json"})
+P3_OUTPUTS = frozenset({"file_dossiers.json", "claude_md_analysis.json"})
+
 
 def count_pattern(text, patterns):
     """Count occurrences of patterns in text (case-insensitive)."""
@@ -111,49 +122,80 @@ def extract_file_data():
     return files
 
 
+_ITEM_START_EVENTS = {"start_map", "start_array", "string", "number", "boolean", "null"}
+_PARSE_ERRORS = (ValueError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+def _read_session_stats(path):
+    """Return (total_messages, frustration peak count) from session_metadata.json.
+
+    Stats live under "session_stats" when present, otherwise at the top
+    level. With ijson the file is streamed and reading stops once
+    session_stats has yielded both values, so large metadata files are not
+    parsed in full.
+    """
+    if ijson is None:
+        s = json.loads(path.read_text())
+        stats = s.get("session_stats", s) if isinstance(s, dict) else {}
+        if not isinstance(stats, dict):
+            return 0, 0
+        fp = stats.get("frustration_peaks", [])
+        return stats.get("total_messages", 0), len(fp) if isinstance(fp, list) else 0
+
+    found = {"": {}, "session_stats": {}}
+    has_stats = False
+    with open(path, "rb") as fh:
+        for prefix, event, value in ijson.parse(fh):
+            if prefix == "" and event == "map_key":
+                has_stats = has_stats or value == "session_stats"
+                continue
+            if prefix.startswith("session_stats."):
+                root, rest = "session_stats", prefix[len("session_stats."):]
+            else:
+                root, rest = "", prefix
+            vals = found[root]
+            if rest == "total_messages" and event == "number":
+                vals["total"] = value
+            elif rest == "frustration_peaks.item" and event in _ITEM_START_EVENTS:
+                vals["peaks"] = vals.get("peaks", 0) + 1
+            elif rest == "frustration_peaks" and event not in ("start_array", "start_map"):
+                vals["peaks_done"] = True
+            stats_vals = found["session_stats"]
+            if "total" in stats_vals and "peaks_done" in stats_vals:
+                break
+
+    vals = found["session_stats"] if has_stats else found[""]
+    return vals.get("total", 0), vals.get("peaks", 0)
+
+
 def extract_session_data():
     """Extract per-session completeness and metadata."""
     sessions = []
-    for sd in sorted(SESSIONS.iterdir()):
-        if not sd.is_dir() or not sd.name.startswith("session_"):
-            continue
-
+    with os.scandir(SESSIONS) as it:
+        entries = sorted((e for e in it if e.name.startswith("session_") and e.is_dir()),
+                         key=lambda e: e.name)
+    for entry in entries:
+        sd = Path(entry.path)
         sid = sd.name.replace("session_", "")
 
-        # Check which phase outputs exist
-        phase_files = {
-            "enriched_session": (sd / "enriched_session.json").exists(),
-            "session_metadata": (sd / "session_metadata.json").exists(),
-            "thread_extractions": (sd / "thread_extractions.json").exists(),
-            "geological_notes": (sd / "geological_notes.json").exists(),
-            "semantic_primitives": (sd / "semantic_primitives.json").exists(),
-            "explorer_notes": (sd / "explorer_notes.json").exists(),
-            "idea_graph": (sd / "idea_graph.json").exists(),
-            "synthesis": (sd / "synthesis.json").exists(),
-            "grounded_markers": (sd / "grounded_markers.json").exists(),
-            "file_dossiers": (sd / "file_dossiers.json").exists(),
-            "claude_md_analysis": (sd / "claude_md_analysis.json").exists(),
-        }
+        # Which phase outputs exist: one directory read instead of 11 stats
+        with os.scandir(entry.path) as it:
+            names = {e.name for e in it}
 
         # Get message count
         msg_count = 0
         frustration_peaks = 0
         summary_path = sd / "session_metadata.json"
-        if summary_path.exists():
+        if "session_metadata.json" in names:
             try:
-                s = json.loads(summary_path.read_text())
-                stats = s.get("session_stats", s) if isinstance(s, dict) else {}
-                if isinstance(stats, dict):
-                    msg_count = stats.get("total_messages", 0)
-                    fp = stats.get("frustration_peaks", [])
-                    frustration_peaks = len(fp) if isinstance(fp, list) else 0
-            except (json.JSONDecodeError, KeyError, TypeError, OSError):
+                msg_count, frustration_peaks = _read_session_stats(summary_path)
+            except _PARSE_ERRORS + (KeyError, TypeError, OSError):
                 pass
 
-        p0 = 1 if phase_files["enriched_session"] else 0
-        p1 = sum(1 for k in ["thread_extractions", "geological_notes", "semantic_primitives", "explorer_notes"] if phase_files[k])
-        p2 = sum(1 for k in ["idea_graph", "synthesis", "grounded_markers"] if phase_files[k])
-        p3 = sum(1 for k in ["file_dossiers", "claude_md_analysis"] if phase_files[k])
+        p0 = int("enriched_session.json" in names)
+        p1 = len(P1_OUTPUTS & names)
+        p2 = len(P2_OUTPUTS & names)
+        p3 = len(P3_OUTPUTS & names)
 
         sessions.append({
             "id": sid[:8],
@@ -214,35 +256,57 @@ def compute_aggregates(files, sessions):
     # State distribution
     state_counts = Counter(f["state"] for f in files)
 
-    # Dead code / missing / key mismatch counts
-    issue_counts = {
-        "dead_code": sum(1 for f in files if f["is_dead_code"]),
-        "missing_from_disk": sum(1 for f in files if f["is_missing"]),
-        "key_mismatch": sum(1 for f in files if f["has_key_mismatch"]),
-        "truncation_violations": sum(1 for f in files if f["has_truncation"]),
-    }
+    # Running totals over files: one pass instead of one sum() per metric
+    issue_counts = {"dead_code": 0, "missing_from_disk": 0, "key_mismatch": 0, "truncation_violations": 0}
+    hd_dist = {"under_10": 0, "10_20": 0, "20_30": 0, "30_40": 0, "40_50": 0, "over_50": 0}
+    total_annotations = total_frictions = total_decisions = total_warnings = total_failed = 0
+    total_size_kb = 0
+    cred_sum = 0.0
+    cred_count = 0
+    for f in files:
+        issue_counts["dead_code"] += f["is_dead_code"]
+        issue_counts["missing_from_disk"] += f["is_missing"]
+        issue_counts["key_mismatch"] += f["has_key_mismatch"]
+        issue_counts["truncation_violations"] += f["has_truncation"]
+        total_annotations += f["annotations"]
+        total_frictions += f["frictions"]
+        total_decisions += f["decisions"]
+        total_warnings += f["warnings"]
+        total_failed += f["failed_approaches"]
+        total_size_kb += f["size_kb"]
+
+        # Hyperdoc size distribution
+        kb = f["size_kb"]
+        if kb < 10: hd_dist["under_10"] += 1
+        elif kb < 20: hd_dist["10_20"] += 1
+        elif kb < 30: hd_dist["20_30"] += 1
+        elif kb < 40: hd_dist["30_40"] += 1
+        elif kb < 50: hd_dist["40_50"] += 1
+        else: hd_dist["over_50"] += 1
+
+        # Credibility scores
+        cred = f["credibility"]
+        if cred:
+            cred_sum += cred["verified"] / max(cred["total"], 1)
+            cred_count += 1
 
-    # Session size distribution
+    # Running totals over sessions: size distribution and phase completion
     size_dist = {"tiny_0_50": 0, "small_51_200": 0, "medium_201_1000": 0,
                  "large_1001_5000": 0, "mega_5000_plus": 0}
+    phase_done = {"p0": 0, "p1": 0, "p2": 0, "p3": 0}
+    total_messages = 0
     for s in sessions:
         m = s["messages"]
+        total_messages += m
         if m <= 50: size_dist["tiny_0_50"] += 1
         elif m <= 200: size_dist["small_51_200"] += 1
         elif m <= 1000: size_dist["medium_201_1000"] += 1
         elif m <= 5000: size_dist["large_1001_5000"] += 1
         else: size_dist["mega_5000_plus"] += 1
-
-    # Hyperdoc size distribution
-    hd_dist = {"under_10": 0, "10_20": 0, "20_30": 0, "30_40": 0, "40_50": 0, "over_50": 0}
-    for f in files:
-        kb = f["size_kb"]
-        if kb < 10: hd_dist["under_10"] += 1
-        elif kb < 20: hd_dist["10_20"] += 1
-        elif kb < 30: hd_dist["20_30"] += 1
-        elif kb < 40: hd_dist["30_40"] += 1
-        elif kb < 50: hd_dist["40_50"] += 1
-        else: hd_dist["over_50"] += 1
+        phase_done["p0"] += s["p0"] > 0
+        phase_done["p1"] += s["p1"] >= 3
+        phase_done["p2"] += s["p2"] >= 2
+        phase_done["p3"] += s["p3"] >= 1
 
     # Top files by various metrics
     top_sessions = sorted(files, key=lambda x: -x["sessions"])[:20]
@@ -252,31 +316,20 @@ def compute_aggregates(files, sessions):
 
     # Phase completion rates
     total_s = len(sessions)
-    phase_rates = {
-        "p0": sum(1 for s in sessions if s["p0"] > 0) / max(total_s, 1) * 100,
-        "p1": sum(1 for s in sessions if s["p1"] >= 3) / max(total_s, 1) * 100,
-        "p2": sum(1 for s in sessions if s["p2"] >= 2) / max(total_s, 1) * 100,
-        "p3": sum(1 for s in sessions if s["p3"] >= 1) / max(total_s, 1) * 100,
-    }
+    phase_rates = {k: v / max(total_s, 1) * 100 for k, v in phase_done.items()}
 
-    # Credibility scores
-    cred_files = [f for f in files if f["credibility"]]
-    avg_cred = 0
-    if cred_files:
-        scores = [f["credibility"]["verified"] / max(f["credibility"]["total"], 1)
-                  for f in cred_files]
-        avg_cred = round(sum(scores) / len(scores) * 100, 1)
+    avg_cred = round(cred_sum / cred_count * 100, 1) if cred_count else 0
 
     return {
         "total_files": len(files),
         "total_sessions": len(sessions),
-        "total_messages": sum(s["messages"] for s in sessions),
-        "total_annotations": sum(f["annotations"] for f in files),
-        "total_frictions": sum(f["frictions"] for f in files),
-        "total_decisions": sum(f["decisions"] for f in files),
-        "total_warnings": sum(f["warnings"] for f in files),
-        "total_failed": sum(f["failed_approaches"] for f in files),
-        "total_size_mb": round(sum(f["size_kb"] for f in files) / 1024, 1),
+        "total_messages": total_messages,
+        "total_annotations": total_annotations,
+        "total_frictions": total_frictions,
+        "total_decisions": total_decisions,
+        "total_warnings": total_warnings,
+        "total_failed": total_failed,
+        "total_size_mb": round(total_size_kb / 1024, 1),
         "enhanced_files": len(list((BASE / "enhanced_files").glob("*.py"))) if (BASE / "enhanced_files").exists() else 0,
         "lines_added": 180820,
         "ext_counts": dict(ext_counts.most_common()),
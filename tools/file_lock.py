@@ -8,11 +8,17 @@ Usage:
 
     # Read with lock (consistent reads during writes):
     data = locked_json_read(path)
+
+    # Single-writer files (per-session outputs): atomic, no lock file
+    atomic_json_dump(path, data)
 """
 import fcntl
 import json
 import os
+import re
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 
@@ -20,7 +26,7 @@ def atomic_json_write(filepath, data, indent=2):
     """Write JSON atomically with advisory lock.
 
     1. Acquires exclusive lock on a .lock file
-    2. Writes to a temp file
+    2. Writes to a temp file and fsyncs it
     3. Atomically renames temp → target
     4. Releases lock
 
@@ -40,6 +46,8 @@ def atomic_json_write(filepath, data, indent=2):
             try:
                 with os.fdopen(fd, "w") as f:
                     json.dump(data, f, indent=indent, default=str)
+                    f.flush()
+                    os.fsync(f.fileno())
                 os.replace(tmp_path, filepath)
             except Exception:
                 os.unlink(tmp_path)
@@ -48,6 +56,96 @@ def atomic_json_write(filepath, data, indent=2):
             fcntl.flock(lock_f, fcntl.LOCK_UN)
 
 
+TMP_MARKER = ".tmp."
+
+
+def atomic_json_dump(filepath, data, indent=2, default=None):
+    """Write JSON atomically without a lock, for files with a single writer.
+
+    Writes <name>.tmp.<pid>.<thread> beside the target, fsyncs it, then
+    os.replace()s it into place, so readers (and --resume existence checks)
+    only ever see the old file or the complete new one. Per-session outputs
+    use this instead of atomic_json_write to avoid leaving .lock files in
+    every session directory. Stale temp files from a killed writer are
+    removed by sweep_tmp_files().
+
+    data may also be bytes that are already serialized JSON (e.g. orjson
+    output); they are written as-is and indent/default are ignored.
+    """
+    filepath = Path(filepath)
+    tmp_path = filepath.with_name(
+        f"{filepath.name}{TMP_MARKER}{os.getpid()}.{threading.get_ident()}")
+    raw = isinstance(data, bytes)
+    try:
+        with open(tmp_path, "wb" if raw else "w") as f:
+            if raw:
+                f.write(data)
+            else:
+                json.dump(data, f, indent=indent, default=default)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# Temp files younger than this are left alone even when their writer looks
+# dead: the pid check cannot see writers on another host or pid namespace
+TMP_MIN_AGE = 300  # seconds
+
+
+# Exactly the names atomic_json_dump writes: <name>.tmp.<pid>.<thread ident>.
+# Anything else with ".tmp." in it (report.tmp.json) is not ours to delete.
+_TMP_NAME = re.compile(r".+" + re.escape(TMP_MARKER) + r"(\d+)\.(\d+)")
+
+
+def _tmp_writer_alive(pid):
+    """True if pid is a live process."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    except OverflowError:
+        return True  # not a pid this host could have written; leave it alone
+    return True
+
+
+def sweep_tmp_files(directory, min_age=TMP_MIN_AGE):
+    """Delete temp files left in a directory by an interrupted atomic_json_dump.
+
+    A temp file is only stale when its writer's pid is no longer running and
+    it is older than min_age seconds; a batch running alongside this one
+    keeps its in-flight temp files. Returns the number of files removed.
+    """
+    removed = 0
+    cutoff = time.time() - min_age
+    candidates = []
+    try:
+        with os.scandir(directory) as it:
+            for e in it:
+                m = _TMP_NAME.fullmatch(e.name)
+                if m and e.is_file():
+                    candidates.append((e, int(m.group(1))))
+    except FileNotFoundError:
+        return 0
+    for entry, pid in candidates:
+        # FileNotFoundError: the writer finished (os.replace) in the meantime
+        try:
+            if entry.stat().st_mtime >= cutoff or _tmp_writer_alive(pid):
+                continue
+            os.unlink(entry.path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
 def locked_json_read(filepath):
     """Read JSON with shared lock (blocks during concurrent writes).
 
@@ -87,6 +87,7 @@ SUB_CLUSTERS = {
     "phase_0_prep/message_filter.py":            ("0", "Libraries"),
     "phase_0_prep/metadata_extractor.py":        ("0", "Libraries"),
     "phase_0_prep/code_similarity.py":           ("0", "Libraries"),
+    "phase_0_prep/phase0_child.py":              ("0", "Libraries"),
     "phase_0_prep/batch_phase0_reprocess.py":    ("0", "Batch"),
     # Phase 1
     "phase_1_extraction/opus_phase1.py":               ("1", "Primary"),
@@ -149,6 +150,7 @@ SUB_CLUSTERS = {
     "tools/json_io.py":       ("tools", "Utilities"),
     "tools/log_config.py":    ("tools", "Utilities"),
     "tools/file_lock.py":     ("tools", "Utilities"),
+    "tools/browser.py":       ("tools", "Utilities"),
 }
 
 # ── Session Data Bus members ────────────────────────────────────────
@@ -24,6 +24,7 @@ from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from tools.browser import open_in_browser
 from tools.log_config import get_logger
 
 logger = get_logger("tools.hyperdoc_comparison")
@@ -285,8 +286,11 @@ def main():
             logger.error(f"ERROR: File not found: {target}")
             sys.exit(1)
         out = run_comparison(target)
-        # Auto-open
-        os.system(f'open "{out}"')
+        # Auto-open without waiting on the browser
+        try:
+            open_in_browser(out)
+        except OSError as e:
+            logger.warning(f"Could not open browser: {e}")
 
 
 if __name__ == "__main__":
@@ -9,10 +9,13 @@ Algorithms:
   - Degree Centrality (in/out/total)
   - Connected Components (BFS on undirected view)
   - Graph-level metrics (density, component count)
+  - Top-N rankings per metric, pre-sorted for the analytics panel
 """
 from __future__ import annotations
 from collections import deque
 
+RANKED_TOP_N = 20  # rows shown in the explorer's analytics table
+
 
 def compute_all(nodes: list[dict], edges: list[dict]) -> dict:
     """
@@ -32,6 +35,7 @@ def compute_all(nodes: list[dict], edges: list[dict]) -> dict:
             "component_count": int,
             "node_count": int,
             "edge_count": int,
+            "ranked": {metric: [[node_id, score], ...]},  # top N, descending
         }
     """
     node_ids = [n["id"] for n in nodes]
@@ -47,6 +51,7 @@ def compute_all(nodes: list[dict], edges: list[dict]) -> dict:
             "component_count": 0,
             "node_count": 0,
             "edge_count": 0,
+            "ranked": {"pagerank": [], "betweenness": [], "degree": []},
         }
 
     pr = _pagerank(node_ids, edge_list)
@@ -67,9 +72,19 @@ def compute_all(nodes: list[dict], edges: list[dict]) -> dict:
         "component_count": len(comps),
         "node_count": n,
         "edge_count": len(edge_list),
+        "ranked": {
+            "pagerank": _top(pr),
+            "betweenness": _top(bc),
+            "degree": _top({k: v["total"] for k, v in deg.items()}),
+        },
     }
 
 
+def _top(scores: dict, n: int = RANKED_TOP_N) -> list[list]:
+    """Highest-scoring [node_id, score] pairs, descending; ties keep node order."""
+    return [[k, v] for k, v in sorted(scores.items(), key=lambda kv: -kv[1])[:n]]
+
+
 # ── PageRank ────────────────────────────────────────────────────────
 
 def _pagerank(
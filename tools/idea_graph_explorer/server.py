@@ -13,6 +13,7 @@ Usage:
 Endpoints:
     GET  /                      → explorer.html page
     GET  /api/sessions          → list all sessions with counts
+    GET  /api/sessions?limit=N&offset=M → one page of that list (+ truncated flag)
     GET  /api/graph/{session_id}→ normalized graph + analytics for one session
     GET  /api/graph/all         → combined graph from all sessions
     POST /api/explain           → send graph context to Opus, get explanation
@@ -22,16 +23,22 @@ from __future__ import annotations
 
 import os
 import sys
+import gzip
 import json
 import re
-import subprocess
-import webbrowser
+import threading
+import time
 import argparse
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
 from typing import Optional, Dict, List
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 # ── .env loading ───────────────────────────────────────────────
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -41,6 +48,7 @@ load_env()
 
 # ── Imports after env setup ─────────────────────────────────────────
 
+from tools.browser import open_in_browser
 from tools.idea_graph_explorer.normalizer import normalize_graph
 from tools.idea_graph_explorer.graph_analytics import compute_all
 
@@ -48,41 +56,79 @@ from tools.idea_graph_explorer.graph_analytics import compute_all
 
 STORE_DIR = Path(os.getenv("HYPERDOCS_STORE_DIR", str(Path.home() / "PERMANENT_HYPERDOCS")))
 SESSIONS_STORE_DIR = STORE_DIR / "sessions"
-TEMPLATES_DIR = _REPO / "templates"
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 DEFAULT_PORT = 8099
+RESPONSE_TTL = 1.0  # seconds a serialized GET response is reused
+RESPONSE_CACHE_MAX = 256  # serialized responses kept at most
 
 # ── Data loading ────────────────────────────────────────────────────
 
-_sessions_cache: dict | None = None
 _graph_cache: dict[str, dict] = {}
+_graph_stamps: dict[str, tuple[int, int]] = {}
+_combined_cache: tuple[tuple, dict] | None = None  # (graph stamps, combined graph)
+# Guards the three caches above. ThreadingHTTPServer runs GET and POST
+# handlers concurrently; reentrant because _get_graph and _get_all_graphs
+# call _load_all_sessions while holding it. Analytics are computed after
+# releasing it, so a slow build does not hold up other sessions.
+_graph_lock = threading.RLock()
+
+
+def _load_graph_file(sid: str, graph_file: str) -> dict | None:
+    """Return the normalized graph for sid, re-parsing only when the file changed.
+
+    The cache key is (st_mtime_ns, st_size), so an unchanged idea_graph.json
+    costs one stat instead of a read + parse + normalize.
+    """
+    try:
+        st = os.stat(graph_file)
+    except FileNotFoundError:
+        _graph_cache.pop(sid, None)
+        _graph_stamps.pop(sid, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _graph_stamps.get(sid) == stamp:
+        return _graph_cache[sid]
+
+    _graph_cache.pop(sid, None)
+    _graph_stamps.pop(sid, None)
+    with open(graph_file) as f:
+        data = json.load(f)
+    g = normalize_graph(data)
+    _graph_cache[sid] = g
+    _graph_stamps[sid] = stamp
+    return g
 
 
 def _load_all_sessions() -> dict:
-    """Scan SESSIONS_STORE_DIR, return session list with metadata."""
-    global _sessions_cache
-    if _sessions_cache is not None:
-        return _sessions_cache
-
-    sessions = []
-    total_nodes = 0
-    total_edges = 0
-
-    if not SESSIONS_STORE_DIR.exists():
-        _sessions_cache = {"sessions": [], "total_nodes": 0, "total_edges": 0}
-        return _sessions_cache
-
-    for session_dir in sorted(SESSIONS_STORE_DIR.iterdir()):
-        if not session_dir.is_dir():
-            continue
-        graph_file = session_dir / "idea_graph.json"
-        if not graph_file.exists():
-            continue
-
-        sid = session_dir.name.replace("session_", "")
+    """Scan SESSIONS_STORE_DIR, return session list with metadata.
+
+    Safe to call on every request: sessions added, removed or rewritten
+    since the last call are picked up, and unchanged graphs are not re-read.
+    """
+    with _graph_lock:
+        sessions = []
+        total_nodes = 0
+        total_edges = 0
+
+        # os.scandir serves is_dir() from the directory entry, so listing the
+        # store costs one readdir instead of one stat per session directory.
         try:
-            with open(graph_file) as f:
-                data = json.load(f)
-            g = normalize_graph(data)
+            with os.scandir(SESSIONS_STORE_DIR) as it:
+                session_names = sorted(e.name for e in it if e.is_dir())
+        except FileNotFoundError:
+            session_names = []
+
+        seen = set()
+        for name in session_names:
+            graph_file = os.path.join(SESSIONS_STORE_DIR, name, "idea_graph.json")
+            sid = name.replace("session_", "")
+            try:
+                g = _load_graph_file(sid, graph_file)
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+            if g is None:
+                continue
+            seen.add(sid)
             nc = len(g["nodes"])
             ec = len(g["edges"])
             sc = len(g["subgraphs"])
@@ -94,30 +140,45 @@ def _load_all_sessions() -> dict:
             })
             total_nodes += nc
             total_edges += ec
-            # Cache the normalized graph
-            _graph_cache[sid] = g
-        except (json.JSONDecodeError, KeyError, TypeError):
-            continue
-
-    _sessions_cache = {
-        "sessions": sessions,
-        "total_nodes": total_nodes,
-        "total_edges": total_edges,
+
+        # Drop graphs whose session directory disappeared
+        for sid in set(_graph_cache) - seen:
+            _graph_cache.pop(sid, None)
+            _graph_stamps.pop(sid, None)
+
+        return {
+            "sessions": sessions,
+            "total_nodes": total_nodes,
+            "total_edges": total_edges,
+        }
+
+
+def _get_sessions_page(offset: int, limit: int | None) -> dict:
+    """Session list sliced to [offset, offset + limit); totals cover all sessions."""
+    info = _load_all_sessions()
+    sessions = info["sessions"]
+    end = len(sessions) if limit is None else offset + limit
+    return {
+        **info,
+        "sessions": sessions[offset:end],
+        "offset": offset,
+        "session_count": len(sessions),
+        "truncated": offset > 0 or end < len(sessions),
     }
-    return _sessions_cache
 
 
 def _get_graph(session_id: str) -> dict | None:
     """Get normalized graph + analytics for a single session."""
-    # Ensure sessions loaded
-    _load_all_sessions()
+    with _graph_lock:
+        # Ensure sessions loaded
+        _load_all_sessions()
+        g = _graph_cache.get(session_id)
 
-    if session_id not in _graph_cache:
+    if g is None:
         return None
 
-    g = _graph_cache[session_id]
-
-    # Compute analytics if not already attached
+    # Compute analytics if not already attached. Two first requests may
+    # both compute them; the results are identical.
     if "analytics" not in g:
         g["analytics"] = compute_all(g["nodes"], g["edges"])
 
@@ -125,14 +186,25 @@ def _get_graph(session_id: str) -> dict | None:
 
 
 def _get_all_graphs() -> dict:
-    """Combine all sessions into one big graph with prefixed node IDs."""
-    _load_all_sessions()
+    """Combine all sessions into one big graph with prefixed node IDs.
+
+    The merge and its analytics (betweenness is O(V*E) over every node)
+    are kept until a session graph is added, removed or rewritten.
+    """
+    global _combined_cache
+    with _graph_lock:
+        _load_all_sessions()
+
+        key = tuple(sorted(_graph_stamps.items()))
+        if _combined_cache is not None and _combined_cache[0] == key:
+            return _combined_cache[1]
+        graphs = list(_graph_cache.items())
 
     all_nodes = []
     all_edges = []
     all_subgraphs = []
 
-    for sid, g in _graph_cache.items():
+    for sid, g in graphs:
         # Prefix node IDs with session ID to avoid collision
         for node in g["nodes"]:
             prefixed = dict(node)
@@ -160,12 +232,13 @@ def _get_all_graphs() -> dict:
         "nodes": all_nodes,
         "edges": all_edges,
         "subgraphs": all_subgraphs,
-        "metadata": {"combined": True, "session_count": len(_graph_cache)},
+        "metadata": {"combined": True, "session_count": len(graphs)},
         "analytics": compute_all(all_nodes, all_edges),
     }
+    with _graph_lock:
+        _combined_cache = (key, combined)
     return combined
 
-
 def _explain(payload: dict) -> dict:
     """Send graph context + question to Opus, return explanation."""
     try:
@@ -261,6 +334,118 @@ Provide a clear, insightful answer. Reference specific node IDs (like N01, N05)
         return {"explanation": f"Error calling Opus: {e}", "referenced_nodes": [], "model": "error"}
 
 
+# ── Response cache ──────────────────────────────────────────────────
+
+_response_cache: dict[str, tuple[float, bytes, bytes]] = {}
+# Per-key build locks: one request builds a key while others for the same
+# key wait for its result; requests for other keys are not held up
+_build_locks: dict[str, threading.Lock] = {}
+# Guards _response_cache and _build_locks only, never held across a build
+_response_lock = threading.Lock()
+
+_html_cache: tuple[tuple[int, int], bytes, bytes] | None = None  # (stamp, raw, gzip response)
+
+
+def _encode_json(data: dict) -> bytes:
+    """Serialize a response payload to UTF-8 JSON bytes.
+
+    orjson (when installed) encodes straight to bytes in C, skipping the
+    intermediate str and the .encode() copy.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _cached_hit(key: str) -> tuple[bytes, bytes] | None:
+    """(body, gzipped body) for key if cached within RESPONSE_TTL. Caller holds _response_lock."""
+    hit = _response_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < RESPONSE_TTL:
+        return hit[1], hit[2]
+    return None
+
+
+def _cached_response(key: str, build) -> tuple[bytes, bytes] | None:
+    """Return (body, gzipped body) for key, rebuilding at most once per RESPONSE_TTL.
+
+    Rapid reloads and multiple open tabs share one build(), one
+    serialization and one compression. Returns None when build() finds
+    nothing.
+
+    build(), encoding and compression run outside _response_lock, under
+    the key's own build lock, so a slow /api/graph/all rebuild never
+    delays cache hits or builds for other keys.
+
+    Entries are kept in build order, so expired ones sit at the front and
+    are dropped on each insert, and RESPONSE_CACHE_MAX caps the rest:
+    distinct session ids and paging pairs cannot grow the cache unbounded.
+    """
+    with _response_lock:
+        hit = _cached_hit(key)
+        if hit is not None:
+            return hit
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        # A request that held the build lock first may have filled the entry
+        with _response_lock:
+            hit = _cached_hit(key)
+        if hit is not None:
+            return hit
+        data = build()
+        if data is None:
+            with _response_lock:
+                _build_locks.pop(key, None)
+            return None
+        body = _encode_json(data)
+        gz = gzip.compress(body, 6)
+
+        with _response_lock:
+            now = time.monotonic()
+            _response_cache.pop(key, None)
+            while _response_cache:
+                oldest = next(iter(_response_cache))
+                if (now - _response_cache[oldest][0] < RESPONSE_TTL
+                        and len(_response_cache) < RESPONSE_CACHE_MAX):
+                    break
+                del _response_cache[oldest]
+                _build_locks.pop(oldest, None)
+            _response_cache[key] = (now, body, gz)
+        return body, gz
+
+def _load_html() -> tuple[bytes, bytes] | None:
+    """Return (explorer.html bytes, full gzip HTTP response), re-reading only when the file changes.
+
+    The gzip response is status line + headers + body in one buffer, so
+    the common case is a single write with no per-request header formatting.
+    """
+    global _html_cache
+    html_path = TEMPLATES_DIR / "explorer.html"
+    try:
+        st = os.stat(html_path)
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _html_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    raw = html_path.read_bytes()
+    gz = gzip.compress(raw, 9)
+    gz_response = (
+        b"%s 200 OK\r\n"
+        b"Content-Type: text/html; charset=utf-8\r\n"
+        b"Content-Encoding: gzip\r\n"
+        b"Content-Length: %d\r\n"
+        b"\r\n" % (BaseHTTPRequestHandler.protocol_version.encode("ascii"), len(gz))
+    ) + gz
+    _html_cache = (stamp, raw, gz_response)
+    return raw, gz_response
+
+
+# Invariant bodies are encoded once at import, not per request
+NOT_FOUND_BODY = _encode_json({"error": "Not found"})
+
+
 # ── HTTP Handler ────────────────────────────────────────────────────
 
 class GraphExplorerHandler(BaseHTTPRequestHandler):
@@ -273,18 +458,32 @@ class GraphExplorerHandler(BaseHTTPRequestHandler):
         if path == "/" or path == "/index.html":
             self._serve_html()
         elif path == "/api/sessions":
-            self._json_response(_load_all_sessions())
+            # Optional ?limit=N&offset=M paging; no params returns every session
+            query = parse_qs(parsed.query)
+            try:
+                offset = max(0, int(query.get("offset", ["0"])[0]))
+                limit = int(query["limit"][0]) if "limit" in query else None
+            except ValueError:
+                self._json_response({"error": "offset and limit must be integers"}, status=400)
+                return
+            if limit is None and offset == 0:
+                self._send_json(*_cached_response(path, _load_all_sessions))
+            else:
+                limit = None if limit is None else max(0, limit)
+                self._send_json(*_cached_response(
+                    f"{path}?offset={offset}&limit={limit}",
+                    lambda: _get_sessions_page(offset, limit)))
         elif path.startswith("/api/graph/all"):
-            self._json_response(_get_all_graphs())
+            self._send_json(*_cached_response("/api/graph/all", _get_all_graphs))
         elif path.startswith("/api/graph/"):
             session_id = path.split("/api/graph/")[1]
-            g = _get_graph(session_id)
-            if g:
-                self._json_response(g)
+            cached = _cached_response(path, lambda: _get_graph(session_id))
+            if cached is not None:
+                self._send_json(*cached)
             else:
                 self._json_response({"error": f"Session {session_id} not found"}, status=404)
         else:
-            self._json_response({"error": "Not found"}, status=404)
+            self._send_json(NOT_FOUND_BODY, status=404)
 
     def do_POST(self):
         parsed = urlparse(self.path)
@@ -301,27 +500,56 @@ class GraphExplorerHandler(BaseHTTPRequestHandler):
             result = _explain(payload)
             self._json_response(result)
         else:
-            self._json_response({"error": "Not found"}, status=404)
+            self._send_json(NOT_FOUND_BODY, status=404)
+
+    def _accepts_gzip(self) -> bool:
+        return "gzip" in self.headers.get("Accept-Encoding", "")
 
     def _serve_html(self):
-        html_path = TEMPLATES_DIR / "explorer.html"
-        if not html_path.exists():
+        html = _load_html()
+        if html is None:
             self.send_response(404)
             self.end_headers()
             self.wfile.write(b"explorer.html not found")
             return
+        raw, gz_response = html
+        if self._accepts_gzip():
+            self.wfile.write(gz_response)
+            return
+        # Uncompressed: let the kernel copy the template straight to the
+        # socket (socket.sendfile falls back to send() where unsupported).
+        try:
+            f = open(TEMPLATES_DIR / "explorer.html", "rb")
+        except FileNotFoundError:
+            f = None
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(html_path.read_bytes())
+        if f is None:
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+            return
+        with f:
+            self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+            self.end_headers()
+            self.connection.sendfile(f)
 
     def _json_response(self, data: dict, status: int = 200):
-        body = json.dumps(data, ensure_ascii=False)
+        self._send_json(_encode_json(data), status=status)
+
+    def _send_json(self, body: bytes, gz: bytes | None = None, status: int = 200):
+        if gz is not None and self._accepts_gzip():
+            body = gz
+        else:
+            gz = None
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Access-Control-Allow-Origin", "*")
+        if gz is not None:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(body.encode("utf-8"))
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         """Suppress default request logging clutter."""
@@ -343,18 +571,17 @@ def main():
     info = _load_all_sessions()
     print(f"Loaded {len(info['sessions'])} sessions ({info['total_nodes']} nodes, {info['total_edges']} edges)")
 
-    server = HTTPServer(("127.0.0.1", port), GraphExplorerHandler)
+    server = ThreadingHTTPServer(("127.0.0.1", port), GraphExplorerHandler)
     url = f"http://127.0.0.1:{port}"
     print(f"Serving at {url}")
 
-    # Auto-open browser
+    # Auto-open browser. The socket is already bound, so the first request
+    # succeeds; the launcher runs detached with its chatter discarded.
     if not args.no_open:
-        if sys.platform == "darwin":
-            subprocess.Popen(["open", url])
-        elif sys.platform == "linux":
-            subprocess.Popen(["xdg-open", url])
-        else:
-            webbrowser.open(url)
+        try:
+            open_in_browser(url)
+        except OSError as e:
+            print(f"Could not open browser ({e}); visit {url}")
 
     try:
         server.serve_forever()
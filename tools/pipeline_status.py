@@ -22,9 +22,29 @@ sys.path.insert(0, str(REPO))
 from config import SESSIONS_STORE_DIR, INDEXES_DIR, OUTPUT_DIR
 from tools.log_config import get_logger
 
+try:
+    import ijson
+except ImportError:  # optional: streaming key probe; full json parse is the fallback
+    ijson = None
+
 logger = get_logger("tools.pipeline_status")
 
 
+def _has_top_level_key(path, key):
+    """True if the JSON object in path has key at the top level.
+
+    With ijson the file is streamed and the scan stops at the first
+    matching key, so nested values are never materialized.
+    """
+    if ijson is None:
+        return key in json.loads(path.read_text())
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "" and event == "map_key" and value == key:
+                return True
+    return False
+
+
 def scan_sessions():
     """Scan all session directories and classify completeness."""
     phases = {
@@ -49,7 +69,7 @@ def scan_sessions():
             "file_count": len(existing),
             "phases": phase_status,
             "has_schema_version": any(
-                "_schema_version" in json.loads((d / f).read_text())
+                _has_top_level_key(d / f, "_schema_version")
                 for f in existing
                 if (d / f).stat().st_size < 1_000_000  # skip huge files
             ) if existing else False,
@@ -98,6 +98,15 @@ def run_script(script_path, session_id, extra_env=None, description="",
 
     logger.info(f"OK: {desc} — {elapsed:.1f}s")
     print(f"  [{elapsed:.1f}s]")
+
+    # llm_pass_runner.py ends its stdout with a "##RESULT##{json}" summary line
+    for line in reversed(result.stdout.rsplit("\n", 5)):
+        if line.startswith("##RESULT##"):
+            usage = json.loads(line[len("##RESULT##"):])
+            print(f"  Cost: ${usage['cost']:.4f} ({usage['input_tokens']:,} in / "
+                  f"{usage['output_tokens']:,} out tokens)")
+            break
+
     return True
 
 